@@ -9,11 +9,7 @@ import os
 nba_teams = teams.get_teams()
 
 # In[2]: Create Team Dictionary
-team_dict = {}
-for i in nba_teams:
-    team_name = i['full_name']
-    team_id = i['id']
-    team_dict[team_name]= team_id
+team_dict = {t['full_name']: t['id'] for t in nba_teams}
 
 # In[3]: Define Function to Get Lineups with Measure Type and Season Type
 def get_lineups(team_id_i, measure_type="Base", season_type="Regular Season", season="2024-25", retries=5, base_delay=3):
@@ -129,7 +125,11 @@ time.sleep(2)  # Brief pause after health check
 print("-" * 30)
 
 # In[5]: Main Loop to Fetch, Merge, and Aggregate Data for Both Season Types
-league_lineup = pd.DataFrame()
+# Collect per-team results and concatenate once after the loop (appending to a
+# growing DataFrame inside the loop re-copies it every iteration).
+frames: list[pd.DataFrame] = []
+# Advanced-stat columns to merge in, per season type (see merging logic below)
+cols_to_keep_cache: dict[str, list[str]] = {}
 # Define the season types you want to fetch
 season_types_to_fetch = ["Regular Season", "Playoffs"]
 # Define the season year you are interested in (can be overridden via NBA_SEASON env var)
@@ -167,14 +167,19 @@ for team_name, team_id_i in team_dict.items():
                team_lineup_advanced is not None and not team_lineup_advanced.empty:
 
                 print(f"    Merging Base and Advanced {season_type} stats...")
-                # Columns to keep from advanced (GROUP_ID + unique advanced stats)
-                base_cols = set(team_lineup_base.columns)
-                adv_cols = set(team_lineup_advanced.columns)
-                # Exclude SEASON_TYPE from base_cols for comparison as it's added in both
-                base_cols_for_compare = base_cols - {'SEASON_TYPE'}
-                adv_unique_cols = list(adv_cols - base_cols_for_compare - {'SEASON_TYPE'}) # Also exclude SEASON_TYPE here
-                cols_to_keep = ['GROUP_ID'] + adv_unique_cols
-                cols_to_keep = [col for col in cols_to_keep if col in team_lineup_advanced.columns] # Ensure columns exist
+                # Columns to keep from advanced (GROUP_ID + unique advanced stats).
+                # The endpoint schema is the same for every team, so work it out
+                # once per season type and reuse it (recompute if it ever changes).
+                cols_to_keep = cols_to_keep_cache.get(season_type)
+                if cols_to_keep is None or not set(cols_to_keep).issubset(team_lineup_advanced.columns):
+                    base_cols = set(team_lineup_base.columns)
+                    adv_cols = set(team_lineup_advanced.columns)
+                    # Exclude SEASON_TYPE from base_cols for comparison as it's added in both
+                    base_cols_for_compare = base_cols - {'SEASON_TYPE'}
+                    adv_unique_cols = list(adv_cols - base_cols_for_compare - {'SEASON_TYPE'}) # Also exclude SEASON_TYPE here
+                    cols_to_keep = ['GROUP_ID'] + adv_unique_cols
+                    cols_to_keep = [col for col in cols_to_keep if col in team_lineup_advanced.columns] # Ensure columns exist
+                    cols_to_keep_cache[season_type] = cols_to_keep
 
                 team_lineup_advanced_subset = team_lineup_advanced[cols_to_keep]
 
@@ -231,7 +236,7 @@ for team_name, team_id_i in team_dict.items():
 
             # Concatenate the results for this season_type to the main DataFrame
             if merged_data_for_season_type is not None and not merged_data_for_season_type.empty:
-                league_lineup = pd.concat([league_lineup, merged_data_for_season_type], ignore_index=True)
+                frames.append(merged_data_for_season_type)
                 team_has_data = True # Mark that we got some data for this team
 
             # Small delay between processing season types for the same team (optional but recommended)
@@ -247,12 +252,14 @@ for team_name, team_id_i in team_dict.items():
     print(f"Finished processing {team_name}. Pausing before next team...")
     time.sleep(2) # Increased delay between teams to be more conservative
 
+league_lineup = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
 print("-" * 30)
 print("All teams processed.")
 
 # Calculate success statistics
 total_teams = len(team_dict)
-teams_with_data = len(league_lineup['team'].unique()) if not league_lineup.empty else 0
+teams_with_data = league_lineup['team'].nunique() if not league_lineup.empty else 0
 print(f"\nSuccess rate: {teams_with_data}/{total_teams} teams ({teams_with_data/total_teams*100:.1f}%)")
 
 # In[6]: Post-processing and Saving
@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
-from typing import List
+from typing import Dict, List
 
 # ---------------------------------------------------------------------------
 # Season
@@ -108,5 +108,48 @@ API_TIMEOUT: int = 120  # seconds per request
 API_RETRIES: int = 7  # more retries — team-by-team makes 30× more calls
 API_BASE_DELAY: float = 3.0  # seconds — first retry wait
 API_BACKOFF_MULTIPLIER: float = 2.0  # exponential backoff factor
-API_CALL_DELAY: float = 2.0  # seconds between consecutive calls (was 1.5)
+API_CALL_DELAY: float = 2.0  # max seconds pace() sleeps after a call while the limiter is backed off
 API_ENDPOINT_DELAY: float = 5.0  # seconds between different endpoint types (was 3.0)
+API_MAX_WORKERS: int = 4  # concurrent in-flight calls for fan-out fetches
+# Fastest average spacing of call starts, shared across threads. The old
+# sequential loop started a call every latency + API_CALL_DELAY seconds; the
+# pool starts one every 2s however long calls take, with up to API_MAX_WORKERS
+# in flight — a higher request rate than before, capped here.
+API_MIN_INTERVAL: float = 2.0
+API_MAX_INTERVAL: float = 10.0  # slowest spacing once failures have backed the limiter off
+API_RATE_STEP: float = 0.25  # calls/s regained after each window of successes
+API_RATE_WINDOW: int = 10  # consecutive successes per speed-up step
+API_RATE_BURST: int = 2  # call starts allowed back-to-back after an idle spell (keep small: throttled publisher)
+API_MAX_BACKOFF: float = 60.0  # cap on a single retry wait (before jitter)
+API_BREAKER_THRESHOLD: int = 5  # consecutive failed attempts that open the circuit
+API_BREAKER_COOLDOWN: float = 30.0  # seconds API calls are paused once it's open
+
+# ---------------------------------------------------------------------------
+# Parquet twins of CSV outputs (local re‑reads only; the CSVs are published)
+# ---------------------------------------------------------------------------
+PARQUET_DIR: Path = DATA_DIR / "parquet"
+
+# ---------------------------------------------------------------------------
+# Per‑task checkpoints (resume an interrupted fetch; cleared once it saves)
+# ---------------------------------------------------------------------------
+CHECKPOINT_DIR: Path = DATA_DIR / "checkpoints"
+CHECKPOINT_TTL: int = 12 * 3600  # seconds — older task results are refetched
+
+# ---------------------------------------------------------------------------
+# On‑disk API response cache (opt‑in: --use-cache or NBA_API_CACHE=1)
+# ---------------------------------------------------------------------------
+API_CACHE_ENABLED: bool = os.getenv("NBA_API_CACHE", "0") == "1"
+API_CACHE_DIR: Path = DATA_DIR / "api_cache"
+API_CACHE_TTL: int = 6 * 3600  # seconds — default freshness for cached responses
+# Per‑endpoint overrides (seconds); season‑long aggregates barely move intra‑day.
+API_CACHE_TTL_BY_ENDPOINT: Dict[str, int] = {
+    "SynergyPlayTypes": 24 * 3600,
+    "LeagueDashPtStats": 12 * 3600,
+    "LeagueDashPtDefend": 12 * 3600,
+    "PlayerEstimatedMetrics": 12 * 3600,
+    "LeagueHustleStatsPlayer": 3600,
+    "LeagueHustleStatsTeam": 3600,
+}
+# Static {team_id: name} map — always used (not tied to the opt‑in cache);
+# delete the file to rebuild it from nba_api's static team list.
+TEAMS_CACHE_PATH: Path = API_CACHE_DIR / "teams.json"
@@ -25,12 +25,12 @@ import json
 import logging
 from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 import pandas as pd
 
 from . import config
-from .utils import save_dataframe, setup_logging
+from .utils import get_team_abbreviations, parquet_twin_path, save_dataframe, setup_logging
 
 logger = logging.getLogger("pipeline.export_web")
 
@@ -50,6 +50,16 @@ SLIM_COLUMNS: List[str] = [
     "SEASON_TYPE", "team", "team_id", "players_list",
 ]
 
+# What slim_one reads from a full lineup file: the published columns plus the
+# filter/derivation inputs. Everything else (~160 columns) is never parsed.
+_SLIM_SOURCE_COLUMNS: Set[str] = set(SLIM_COLUMNS) | {"PER_MODE"}
+
+# The on/off columns the exporters use (team map + NET_SWING).
+_ON_OFF_COLUMNS: Set[str] = {
+    "VS_PLAYER_ID", "TEAM_ABBREVIATION", "TEAM_ID",
+    "COURT_STATUS", "SEASON_TYPE", "MIN", "NET_RATING",
+}
+
 TeamKey = Tuple[str, int]  # (abbreviation, team_id)
 
 # Curated columns for the pre-joined player index (the /players table). Drawn
@@ -76,24 +86,57 @@ PLAYER_INDEX_COLUMNS: List[str] = [
 ]
 
 
+# Parsed on/off frames and the player→team maps derived from them, keyed by
+# (path, mtime) so every export in a run shares one read of the file while a
+# re-fetched CSV (new mtime) is picked up automatically.
+_ON_OFF_CACHE: Dict[Tuple[Path, float], pd.DataFrame] = {}
+_TEAM_MAP_CACHE: Dict[Tuple[Path, float], Dict[int, Set[TeamKey]]] = {}
+
+
+def _load_on_off(season: str) -> Tuple[Optional[Tuple[Path, float]], Optional[pd.DataFrame]]:
+    """Read the on/off table once per (path, mtime); returns ``(cache_key, df)``.
+
+    Both are ``None`` if the file is missing.
+    """
+    path = config.DATA_DIR / f"on_off_{season}.csv"
+    mtimes = [p.stat().st_mtime for p in (path, parquet_twin_path(path)) if p.exists()]
+    if not mtimes:
+        return None, None
+    key = (path, max(mtimes))
+    if key not in _ON_OFF_CACHE:
+        _ON_OFF_CACHE.clear()
+        _TEAM_MAP_CACHE.clear()
+        _ON_OFF_CACHE[key] = _read_table(path, _ON_OFF_COLUMNS)
+    return key, _ON_OFF_CACHE[key]
+
+
 def build_player_team_map(season: str) -> Dict[int, Set[TeamKey]]:
     """Map player id -> set of (team_abbrev, team_id) from the on/off CSV.
 
-    A traded player maps to more than one team, hence a set.
+    A traded player maps to more than one team, hence a set. The map is built
+    once per on/off file and shared by the slim exports and the 5-man enrich.
     """
-    path = config.DATA_DIR / f"on_off_{season}.csv"
-    if not path.exists():
-        logger.warning("on/off file not found (%s) — cannot reconstruct team.", path)
+    key, df = _load_on_off(season)
+    if df is None:
+        logger.warning(
+            "on/off file not found (%s) — cannot reconstruct team.",
+            config.DATA_DIR / f"on_off_{season}.csv",
+        )
         return {}
+    if key in _TEAM_MAP_CACHE:
+        return _TEAM_MAP_CACHE[key]
 
-    df = pd.read_csv(path)
+    # Dedupe the (player, team) pairs first — the file repeats each pair for
+    # On/Off × season type, so the Python loop below only sees unique rows.
+    pairs = df[["VS_PLAYER_ID", "TEAM_ABBREVIATION", "TEAM_ID"]].drop_duplicates()
     mapping: Dict[int, Set[TeamKey]] = {}
-    for pid, abbr, tid in zip(df["VS_PLAYER_ID"], df["TEAM_ABBREVIATION"], df["TEAM_ID"]):
+    for pid, abbr, tid in zip(pairs["VS_PLAYER_ID"], pairs["TEAM_ABBREVIATION"], pairs["TEAM_ID"]):
         try:
             mapping.setdefault(int(pid), set()).add((str(abbr), int(tid)))
         except (TypeError, ValueError):
             continue
-    logger.info("Player→team map: %d players from %s", len(mapping), path.name)
+    _TEAM_MAP_CACHE[key] = mapping
+    logger.info("Player→team map: %d players from %s", len(mapping), key[0].name)
     return mapping
 
 
@@ -119,14 +162,32 @@ def _derive_team(group_id: str, pmap: Dict[int, Set[TeamKey]]) -> TeamKey:
     return counts.most_common(1)[0][0] if counts else (None, None)  # type: ignore[return-value]
 
 
+def _derive_teams(group_ids, pmap: Dict[int, Set[TeamKey]]) -> Tuple[List, List]:
+    """Vector form of :func:`_derive_team` → ``(abbrevs, team_ids)`` aligned to *group_ids*.
+
+    The same lineup (``GROUP_ID``) repeats across season types and per-modes,
+    so each distinct one is resolved once and the repeats are dict lookups.
+    """
+    by_lineup: Dict[str, TeamKey] = {}
+    abbrevs, team_ids = [], []
+    for gid in group_ids:
+        team = by_lineup.get(gid)
+        if team is None:
+            team = by_lineup[gid] = _derive_team(gid, pmap)
+        abbrevs.append(team[0])
+        team_ids.append(team[1])
+    return abbrevs, team_ids
+
+
 def enrich_lineup_teams(season: str = config.SEASON) -> Optional[Path]:
     """Append team/team_id columns to the raw 5-man file (legacy-file contract).
 
     The dashboard's team grid and filters key on a per-lineup ``team``; the
     Railway-era ``NBALineup…`` files carried it, but the pipeline's raw merge
-    doesn't. Derive it the same way the slim exports do (GROUP_ID → the team
-    common to the five players, via the on/off roster map). Idempotent —
-    a file that already has the columns is left untouched.
+    doesn't. Files that already carry the fetched ``team_id`` get its
+    abbreviation; older ones derive both the same way the slim exports do
+    (GROUP_ID → the team common to the five players, via the on/off roster
+    map). Idempotent — a file that already has ``team`` is left untouched.
     """
     path = config.DATA_DIR / f"lineups_5man_{season}.csv"
     if not path.exists():
@@ -134,39 +195,74 @@ def enrich_lineup_teams(season: str = config.SEASON) -> Optional[Path]:
     df = pd.read_csv(path, low_memory=False)
     if "team" in df.columns:
         return path
-    pmap = build_player_team_map(season)
-    if not pmap:
-        logger.warning("enrich_lineup_teams(%s): no on/off roster map — skipped", season)
-        return None
-    derived = [_derive_team(g, pmap) for g in df["GROUP_ID"]]
-    df["team"] = [t[0] for t in derived]
-    df["team_id"] = [t[1] for t in derived]
+    if "team_id" in df.columns:
+        df["team"] = df["team_id"].map(get_team_abbreviations())
+    else:
+        pmap = build_player_team_map(season)
+        if not pmap:
+            logger.warning("enrich_lineup_teams(%s): no on/off roster map — skipped", season)
+            return None
+        df["team"], df["team_id"] = _derive_teams(df["GROUP_ID"], pmap)
     df.to_csv(path, index=False)
     logger.info("✓ Enriched %s with team columns (%d rows)", path.name, len(df))
     return path
 
 
-def slim_one(season: str, group_quantity: int, min_minutes: float, pmap: Dict[int, Set[TeamKey]]) -> Optional[Path]:
-    """Produce one ``lineups_slim_{gq}man_<season>.csv``. Returns the path or None."""
-    src = config.DATA_DIR / f"lineups_{group_quantity}man_{season}.csv"
+def _read_table(src: Path, columns: Optional[Iterable[str]] = None) -> Optional[pd.DataFrame]:
+    """Load a pipeline CSV, preferring its Parquet twin (``data/parquet/``) when current.
+
+    The twin skips CSV parsing and keeps typed / list columns (e.g.
+    ``players_list``); the CSV stays the fallback (and the published file).
+    With *columns*, only those present in the file are read (column
+    pushdown). The CSV fallback uses pandas' default parser, so it still
+    works when pyarrow is not installed.
+    Returns ``None`` if neither file exists.
+    """
+    twin = parquet_twin_path(src)
+    wanted = set(columns) if columns is not None else None
+    if twin.exists() and (not src.exists() or twin.stat().st_mtime >= src.stat().st_mtime):
+        try:
+            if wanted is None:
+                return pd.read_parquet(twin)
+            import pyarrow.parquet as pq
+
+            names = pq.read_schema(twin).names
+            return pd.read_parquet(twin, columns=[c for c in names if c in wanted])
+        except Exception as exc:  # missing pyarrow / corrupt file → CSV
+            logger.warning("Could not read %s (%s) — falling back to CSV.", twin.name, exc)
     if not src.exists():
-        logger.warning("Source not found: %s — skipping %d-man.", src, group_quantity)
         return None
+    if wanted is None:
+        return pd.read_csv(src, low_memory=False)
+    header = pd.read_csv(src, nrows=0).columns
+    return pd.read_csv(src, usecols=[c for c in header if c in wanted], low_memory=False)
+
+
+def _read_lineups(
+    season: str,
+    group_quantity: int,
+    columns: Optional[Iterable[str]] = None,
+) -> Optional[pd.DataFrame]:
+    """Load a full lineup file (Parquet twin first, see :func:`_read_table`)."""
+    src = config.DATA_DIR / f"lineups_{group_quantity}man_{season}.csv"
+    df = _read_table(src, columns)
+    if df is None:
+        logger.warning("Source not found: %s — skipping %d-man.", src, group_quantity)
+    return df
+
 
-    df = pd.read_csv(src, low_memory=False)
+def slim_one(season: str, group_quantity: int, min_minutes: float, pmap: Dict[int, Set[TeamKey]]) -> Optional[Path]:
+    """Produce one ``lineups_slim_{gq}man_<season>.csv``. Returns the path or None."""
+    df = _read_lineups(season, group_quantity, columns=_SLIM_SOURCE_COLUMNS)
+    if df is None:
+        return None
 
     if "PER_MODE" in df.columns:
         df = df[df["PER_MODE"] == "Totals"]
     df = df[pd.to_numeric(df["MIN"], errors="coerce").fillna(0) >= min_minutes].copy()
 
     # Reconstruct team (abbrev) + team_id from the player ids in GROUP_ID.
-    abbrevs, team_ids = [], []
-    for gid in df["GROUP_ID"]:
-        abbr, tid = _derive_team(gid, pmap)
-        abbrevs.append(abbr)
-        team_ids.append(tid)
-    df["team"] = abbrevs
-    df["team_id"] = team_ids
+    df["team"], df["team_id"] = _derive_teams(df["GROUP_ID"], pmap)
 
     before = len(df)
     df = df[df["team"].notna()]
@@ -174,18 +270,21 @@ def slim_one(season: str, group_quantity: int, min_minutes: float, pmap: Dict[in
     if dropped:
         logger.warning("  %d %d-man rows dropped (no team match).", dropped, group_quantity)
 
-    # Clean player list from GROUP_NAME, stored as JSON for the frontend.
-    df["players_list"] = (
-        df["GROUP_NAME"].fillna("").apply(
-            lambda s: json.dumps([p.strip() for p in str(s).split(" - ") if p.strip()])
-        )
+    # Clean player list, stored as JSON for the frontend. The Parquet source
+    # already carries it as a list; the CSV one has to re-split GROUP_NAME.
+    if "players_list" in df.columns and not df["players_list"].map(lambda v: isinstance(v, str)).any():
+        players = df["players_list"]
+    else:
+        players = df["GROUP_NAME"].fillna("").astype(str).str.split(" - ")
+    df["players_list"] = players.map(
+        lambda names: json.dumps([p.strip() for p in names if p.strip()])
     )
 
     cols = [c for c in SLIM_COLUMNS if c in df.columns]
     out = df[cols].sort_values("MIN", ascending=False)
 
     dest = config.DATA_DIR / f"lineups_slim_{group_quantity}man_{season}.csv"
-    save_dataframe(out, dest)
+    save_dataframe(out, dest).result()  # the size below needs the file
     size_kb = dest.stat().st_size / 1024
     logger.info(
         "✓ %d-man slim: %d rows × %d cols → %s (%.0f KB)",
@@ -213,40 +312,44 @@ def _onoff_swing(season: str) -> Optional[pd.DataFrame]:
     Returns a frame keyed by ``(PLAYER_ID, SEASON_TYPE)`` with ON/OFF/SWING, or
     ``None`` if the on/off file is missing.
     """
-    path = config.DATA_DIR / f"on_off_{season}.csv"
-    if not path.exists():
-        logger.warning("on/off file not found (%s) — NET_SWING omitted.", path)
+    _, df = _load_on_off(season)
+    if df is None:
+        logger.warning(
+            "on/off file not found (%s) — NET_SWING omitted.",
+            config.DATA_DIR / f"on_off_{season}.csv",
+        )
         return None
 
-    df = pd.read_csv(path, low_memory=False)
+    df = df.copy()
     for col in ("MIN", "NET_RATING"):
         if col in df.columns:
             df[col] = pd.to_numeric(df[col], errors="coerce")
 
-    rows: List[dict] = []
-    for (pid, stype), grp in df.groupby(["VS_PLAYER_ID", "SEASON_TYPE"]):
-        on = grp[grp["COURT_STATUS"] == "On"]
-        off = grp[grp["COURT_STATUS"] == "Off"]
-        if on.empty or on["MIN"].isna().all():
-            continue
-        on_row = on.loc[on["MIN"].idxmax()]  # the player's primary team
-        team_off = off[off["TEAM_ID"] == on_row["TEAM_ID"]]
-        on_net = on_row["NET_RATING"]
-        off_net = team_off["NET_RATING"].iloc[0] if not team_off.empty else None
-        has_off = off_net is not None and pd.notna(off_net)
-        swing = on_net - off_net if pd.notna(on_net) and has_off else None
-        try:
-            pid_int = int(pid)
-        except (TypeError, ValueError):
-            continue
-        rows.append({
-            "PLAYER_ID": pid_int,
-            "SEASON_TYPE": stype,
-            "ON_NET_RATING": round(float(on_net), 1) if pd.notna(on_net) else None,
-            "OFF_NET_RATING": round(float(off_net), 1) if has_off else None,
-            "NET_SWING": round(float(swing), 1) if swing is not None else None,
-        })
-    return pd.DataFrame(rows)
+    # One vectorised pass instead of a Python loop per (player, season type):
+    # pick each player's max-MIN "On" row (their primary team), then join that
+    # team's first "Off" row on the same keys.
+    keys = ["VS_PLAYER_ID", "SEASON_TYPE"]
+    on = df[df["COURT_STATUS"] == "On"].dropna(subset=["MIN"])
+    on = on.loc[on.groupby(keys)["MIN"].idxmax(), keys + ["TEAM_ID", "NET_RATING"]]
+    off = (
+        df[(df["COURT_STATUS"] == "Off") & df["TEAM_ID"].notna()]
+        .drop_duplicates(keys + ["TEAM_ID"])[keys + ["TEAM_ID", "NET_RATING"]]
+    )
+    both = on.merge(off, on=keys + ["TEAM_ID"], how="left", suffixes=("_ON", "_OFF"))
+
+    pid = pd.to_numeric(both["VS_PLAYER_ID"], errors="coerce")
+    both = both[pid.notna()]
+
+    def _r1(s: pd.Series) -> pd.Series:
+        return s.map(lambda v: round(float(v), 1) if pd.notna(v) else None)
+
+    return pd.DataFrame({
+        "PLAYER_ID": pid[pid.notna()].astype(int).to_numpy(),
+        "SEASON_TYPE": both["SEASON_TYPE"].to_numpy(),
+        "ON_NET_RATING": _r1(both["NET_RATING_ON"]).to_numpy(),
+        "OFF_NET_RATING": _r1(both["NET_RATING_OFF"]).to_numpy(),
+        "NET_SWING": _r1(both["NET_RATING_ON"] - both["NET_RATING_OFF"]).to_numpy(),
+    })
 
 
 def export_player_index(season: str = config.SEASON) -> Optional[Path]:
@@ -260,7 +363,7 @@ def export_player_index(season: str = config.SEASON) -> Optional[Path]:
         logger.warning("player_stats not found (%s) — skipping player index.", stats_path)
         return None
 
-    df = pd.read_csv(stats_path, low_memory=False)
+    df = _read_table(stats_path)
 
     # Note: the estimated impact metrics (E_OFF/DEF/NET/USG…) already ship inside
     # player_stats via the Advanced measure, so we do NOT merge estimated_metrics
@@ -274,7 +377,7 @@ def export_player_index(season: str = config.SEASON) -> Optional[Path]:
     # Clutch on-court net rating (+ clutch minutes) for the leverage split.
     clutch_path = config.DATA_DIR / f"player_clutch_{season}.csv"
     if clutch_path.exists():
-        cl = pd.read_csv(clutch_path, low_memory=False)
+        cl = _read_table(clutch_path)
         if {"PLAYER_ID", "SEASON_TYPE", "NET_RATING", "MIN"}.issubset(cl.columns):
             cl = cl[["PLAYER_ID", "SEASON_TYPE", "NET_RATING", "MIN"]].rename(
                 columns={"NET_RATING": "CLUTCH_NET_RATING", "MIN": "CLUTCH_MIN"}
@@ -287,7 +390,7 @@ def export_player_index(season: str = config.SEASON) -> Optional[Path]:
     if team_path.exists():
         from .compute_impact import compute_bpm_vorp
 
-        bpm = compute_bpm_vorp(df, pd.read_csv(team_path, low_memory=False))
+        bpm = compute_bpm_vorp(df, _read_table(team_path))
         if not bpm.empty:
             df = df.merge(bpm, on=["PLAYER_ID", "SEASON_TYPE"], how="left")
 
@@ -296,7 +399,7 @@ def export_player_index(season: str = config.SEASON) -> Optional[Path]:
     if sz_path.exists():
         from .compute_impact import compute_shotmaking
 
-        sm = compute_shotmaking(pd.read_csv(sz_path, low_memory=False))
+        sm = compute_shotmaking(_read_table(sz_path))
         if not sm.empty:
             df = df.merge(sm, on=["PLAYER_ID", "SEASON_TYPE"], how="left")
 
@@ -358,7 +461,7 @@ def export_player_index(season: str = config.SEASON) -> Optional[Path]:
         out = out.sort_values("MIN", ascending=False)
 
     dest = config.DATA_DIR / f"player_index_{season}.csv"
-    save_dataframe(out, dest)
+    save_dataframe(out, dest).result()  # the size below needs the file
     size_kb = dest.stat().st_size / 1024
     logger.info(
         "✓ Player index: %d rows × %d cols → %s (%.0f KB)",
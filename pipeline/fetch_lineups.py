@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import logging
 import time
+from itertools import product
 from typing import Dict, List, Optional
 
 import pandas as pd
@@ -17,10 +18,14 @@ from nba_api.stats.endpoints import teamdashlineups
 from . import config
 from .utils import (
     api_call_with_retry,
+    clear_checkpoint,
     get_all_team_ids,
     get_team_name,
+    map_checkpointed,
+    map_concurrently,
     merge_measure_types,
     pace,
+    result_set_frames,
     save_dataframe,
 )
 
@@ -43,6 +48,8 @@ def fetch_all_lineups(
 
     Loops through all 30 teams using ``TeamDashLineups`` and concatenates the
     results.  This avoids the 2000‑row cap imposed by ``LeagueDashLineups``.
+    Each team's response is checkpointed (:func:`utils.map_checkpointed`),
+    so after an interruption only the missing teams are fetched again.
 
     Args:
         season: E.g. ``"2025-26"``.
@@ -65,9 +72,9 @@ def fetch_all_lineups(
     )
 
     team_ids = get_all_team_ids()
-    team_frames: List[pd.DataFrame] = []
 
-    for idx, team_id in enumerate(team_ids, 1):
+    def _fetch_team(indexed: tuple) -> Optional[pd.DataFrame]:
+        idx, team_id = indexed
         team_name = get_team_name(team_id)
         logger.info(
             "  [%d/%d] %s (ID %d) — %s / %d-man / %s / %s",
@@ -80,6 +87,7 @@ def fetch_all_lineups(
             per_mode,
             measure_type,
         )
+        df: Optional[pd.DataFrame] = None
         try:
             result = api_call_with_retry(
                 teamdashlineups.TeamDashLineups,
@@ -99,10 +107,11 @@ def fetch_all_lineups(
                     rank="N",
                 ),
             )
-            # TeamDashLineups returns lineup data in the SECOND DataFrame (index 1)
-            df_list = result.get_data_frames()
-            if len(df_list) > 1 and not df_list[1].empty:
-                team_frames.append(df_list[1])
+            # TeamDashLineups returns lineup data in the SECOND result set
+            # (index 1); the first (team overall) is never built.
+            df_list = result_set_frames(result, 1)
+            if df_list is not None and not df_list[0].empty:
+                df = df_list[0]
         except Exception as exc:
             logger.error(
                 "Failed to fetch lineups for %s (%s/%s/%d-man/%s/%s): %s",
@@ -115,6 +124,26 @@ def fetch_all_lineups(
                 exc,
             )
         pace()  # respect rate limits between calls
+        return df
+
+    # Checkpointed per team call, so a resumed run refetches exactly the
+    # teams that failed — never reuses a combo that is missing some. Called
+    # from a pool worker (fetch_and_merge_lineups) the teams run inline.
+    fetched = map_checkpointed(
+        f"lineups_{season}",
+        _fetch_team,
+        list(enumerate(team_ids, 1)),
+        key=lambda it: (season_type, group_quantity, per_mode, measure_type, it[1]),
+    )
+    # The Lineups result set has no team column, and a group traded together
+    # appears under the same GROUP_ID for both teams — tag the team (as the
+    # files' existing team_id column) so the measure‑type merge can key on
+    # (GROUP_ID, team_id).
+    team_frames: List[pd.DataFrame] = []
+    for team_id, df in zip(team_ids, fetched):
+        if df is not None:
+            df["team_id"] = team_id
+            team_frames.append(df)
 
     if not team_frames:
         logger.warning(
@@ -143,13 +172,58 @@ def fetch_all_lineups(
 # ---------------------------------------------------------------------------
 
 
+def _merge_combo(
+    measure_frames: Dict[str, pd.DataFrame],
+    season_type: str,
+    group_quantity: int,
+    per_mode: str,
+) -> Optional[pd.DataFrame]:
+    """Merge one combo's measure-type frames on ``(GROUP_ID, team_id)`` and tag metadata.
+
+    Returns ``None`` when nothing was fetched or the merge came back empty.
+    """
+    if not measure_frames:
+        logger.warning(
+            "No data for combo %s/%d-man/%s — skipping.",
+            season_type,
+            group_quantity,
+            per_mode,
+        )
+        return None
+
+    merged = merge_measure_types(measure_frames, merge_key=["GROUP_ID", "team_id"])
+    if merged.empty:
+        return None
+
+    # Add metadata columns
+    merged["SEASON_TYPE"] = season_type
+    merged["GROUP_QUANTITY"] = group_quantity
+    merged["PER_MODE"] = per_mode
+
+    # No "team" column here: export_web.enrich_lineup_teams adds the
+    # abbreviation the dashboard keys on (from team_id), and skips files that
+    # already have a "team" column.
+
+    # Build a clean player list from GROUP_NAME
+    if "GROUP_NAME" in merged.columns:
+        merged["players_list"] = (
+            merged["GROUP_NAME"]
+            .fillna("")
+            .str.split(" - ")
+        )
+    return merged
+
+
 def fetch_and_merge_lineups(season: str = config.SEASON) -> Dict[int, pd.DataFrame]:
     """Fetch, merge, and save lineup data for every configured combination.
 
-    For each ``(season_type, group_quantity, per_mode)`` tuple the function
-    fetches all 7 measure types and merges them on ``GROUP_ID``.  The merged
-    frames are then concatenated per group quantity (adding metadata columns)
-    and written to CSV.
+    For each ``(season_type, per_mode)`` pass the function fetches every
+    group quantity × measure type concurrently (each team call is
+    checkpointed — see :func:`fetch_all_lineups` — so an interrupted run
+    resumes where it stopped), then merges each group quantity's measure types on
+    ``(GROUP_ID, team_id)``.  The merged frames are concatenated per group quantity
+    (adding metadata columns) and written to CSV, plus a Parquet copy for
+    the local exporters.
 
     Args:
         season: Season string, e.g. ``"2025-26"``.
@@ -160,67 +234,43 @@ def fetch_and_merge_lineups(season: str = config.SEASON) -> Dict[int, pd.DataFra
     # Accumulator: group_quantity → list of DataFrames (one per season_type × per_mode)
     accumulators: Dict[int, List[pd.DataFrame]] = {gq: [] for gq in config.GROUP_QUANTITIES}
 
-    total_combos = (
-        len(config.SEASON_TYPES)
-        * len(config.GROUP_QUANTITIES)
-        * len(config.PER_MODES)
-    )
-    combo_idx = 0
+    total_passes = len(config.SEASON_TYPES) * len(config.PER_MODES)
+    pass_idx = 0
 
     for season_type in config.SEASON_TYPES:
-        for group_quantity in config.GROUP_QUANTITIES:
-            for per_mode in config.PER_MODES:
-                combo_idx += 1
-                logger.info(
-                    "— Combo %d/%d: %s | %d-man | %s",
-                    combo_idx,
-                    total_combos,
-                    season_type,
-                    group_quantity,
-                    per_mode,
-                )
-
-                measure_frames: Dict[str, pd.DataFrame] = {}
-                for mt in config.MEASURE_TYPES:
-                    df = fetch_all_lineups(season, season_type, group_quantity, per_mode, mt)
-                    if df is not None and not df.empty:
-                        measure_frames[mt] = df
-                    pace()  # respect rate limits between calls
-
-                if not measure_frames:
-                    logger.warning(
-                        "No data for combo %s/%d-man/%s — skipping.",
-                        season_type,
-                        group_quantity,
-                        per_mode,
-                    )
-                    continue
-
-                merged = merge_measure_types(measure_frames, merge_key="GROUP_ID")
-                if merged.empty:
-                    continue
-
-                # Add metadata columns
-                merged["SEASON_TYPE"] = season_type
-                merged["GROUP_QUANTITY"] = group_quantity
-                merged["PER_MODE"] = per_mode
-
-                # Add team full name from TEAM_ID
-                if "TEAM_ID" in merged.columns:
-                    merged["team"] = merged["TEAM_ID"].apply(get_team_name)
-
-                # Build a clean player list from GROUP_NAME
-                if "GROUP_NAME" in merged.columns:
-                    merged["players_list"] = (
-                        merged["GROUP_NAME"]
-                        .fillna("")
-                        .str.split(" - ")
-                    )
-
-                accumulators[group_quantity].append(merged)
-
-                # Slightly longer pause between different combos
-                time.sleep(config.API_ENDPOINT_DELAY)
+        for per_mode in config.PER_MODES:
+            pass_idx += 1
+            logger.info(
+                "— Pass %d/%d: %s | %s | %s-man",
+                pass_idx,
+                total_passes,
+                season_type,
+                per_mode,
+                "/".join(str(gq) for gq in config.GROUP_QUANTITIES),
+            )
+
+            # Every (group_quantity, measure_type) request in a pass is
+            # independent — fetch them all concurrently. Results come back in
+            # task order, so each group's measure types stay in MEASURE_TYPES
+            # order, which merge_measure_types relies on for "first frame wins".
+            tasks = list(product(config.GROUP_QUANTITIES, config.MEASURE_TYPES))
+            fetched = map_concurrently(
+                lambda task: fetch_all_lineups(season, season_type, task[0], per_mode, task[1]),
+                tasks,
+            )
+
+            for group_quantity in config.GROUP_QUANTITIES:
+                measure_frames: Dict[str, pd.DataFrame] = {
+                    mt: df
+                    for (gq, mt), df in zip(tasks, fetched)
+                    if gq == group_quantity and df is not None and not df.empty
+                }
+                merged = _merge_combo(measure_frames, season_type, group_quantity, per_mode)
+                if merged is not None:
+                    accumulators[group_quantity].append(merged)
+
+            # Slightly longer pause between different passes
+            time.sleep(config.API_ENDPOINT_DELAY)
 
     # ---- Concatenate and save per group quantity ----
     results: Dict[int, pd.DataFrame] = {}
@@ -232,6 +282,20 @@ def fetch_and_merge_lineups(season: str = config.SEASON) -> Dict[int, pd.DataFra
 
         combined = pd.concat(frames, ignore_index=True)
 
+        # Low-cardinality metadata → category codes: one byte per row instead of
+        # a Python string, and the sort below compares codes. Categories are
+        # lexically ordered, so the sort order (and the CSV) is unchanged.
+        for col in ("team", "SEASON_TYPE", "PER_MODE"):
+            if col in combined.columns:
+                combined[col] = combined[col].astype("category")
+        combined["GROUP_QUANTITY"] = combined["GROUP_QUANTITY"].astype("int8")
+        # Remaining free-text columns (GROUP_ID, GROUP_NAME, …) → Arrow-backed
+        # strings: contiguous UTF-8 buffers instead of one Python object per
+        # cell. players_list holds lists and stays object. The CSV is unchanged.
+        for col in combined.columns:
+            if col != "players_list" and combined[col].dtype == object:
+                combined[col] = combined[col].astype("string[pyarrow]")
+
         # Sort for readability
         sort_cols = [c for c in ["team", "SEASON_TYPE", "PER_MODE", "MIN"] if c in combined.columns]
         if sort_cols:
@@ -239,7 +303,9 @@ def fetch_and_merge_lineups(season: str = config.SEASON) -> Dict[int, pd.DataFra
             combined = combined.sort_values(by=sort_cols, ascending=ascending)
 
         filepath = config.DATA_DIR / f"lineups_{gq}man_{season}.csv"
-        save_dataframe(combined, filepath)
+        # Parquet twin for local re-reads (export_web): players_list stays a
+        # real list column instead of a stringified Python repr.
+        save_dataframe(combined, filepath, twin=True)
         results[gq] = combined
         logger.info(
             "✓ %d-man lineups: %d rows × %d cols → %s",
@@ -249,4 +315,6 @@ def fetch_and_merge_lineups(season: str = config.SEASON) -> Dict[int, pd.DataFra
             filepath,
         )
 
+    if results:
+        clear_checkpoint(f"lineups_{season}")
     return results
@@ -100,17 +100,16 @@ MIN_POSSESSIONS = 200
 
 def _get_json(endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
     """GET a stats.nba.com endpoint as JSON via curl_cffi, with backoff retry."""
-    from curl_cffi import requests as cffi
+    from .nba_http_patch import reset_session, session
 
     url = f"https://stats.nba.com/stats/{endpoint}"
     last_exc: Optional[Exception] = None
     for attempt in range(config.API_RETRIES):
         try:
-            resp = cffi.get(
+            resp = session().get(
                 url,
                 params=params,
                 headers=_STATS_HEADERS,
-                impersonate="chrome",
                 timeout=config.API_TIMEOUT,
             )
             if resp.status_code == 200:
@@ -118,6 +117,7 @@ def _get_json(endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
             last_exc = RuntimeError(f"HTTP {resp.status_code}")
         except Exception as exc:  # pragma: no cover - network
             last_exc = exc
+        reset_session()
         wait = config.API_BASE_DELAY * (config.API_BACKOFF_MULTIPLIER ** attempt)
         logger.warning(
             "%s attempt %d/%d failed (%s) — retrying in %.1fs",
@@ -2,29 +2,68 @@
 
 Each public function in this module fetches one category of supplementary data,
 writes it to CSV, and returns the resulting DataFrame (or ``None`` on failure).
-All functions use :func:`utils.api_call_with_retry` for resilient HTTP calls.
+All functions use :func:`utils.api_call_with_retry` for resilient HTTP calls;
+the multi-request ones (on/off, play types, hustle, tracking, defense,
+estimated metrics) fan their calls out over :func:`utils.map_checkpointed`,
+which stays under the shared rate limiter and lets an interrupted run resume
+without refetching the calls that already succeeded.
 """
 
 from __future__ import annotations
 
 import logging
-import time
+from itertools import product
 from typing import List, Optional
 
 import pandas as pd
+from nba_api.stats.endpoints import (
+    leaguedashplayerclutch,
+    leaguedashplayerptshot,
+    leaguedashplayershotlocations,
+    leaguedashplayerstats,
+    leaguedashptdefend,
+    leaguedashptstats,
+    leaguedashteamclutch,
+    leaguedashteamstats,
+    leaguegamelog,
+    leaguehustlestatsplayer,
+    leaguehustlestatsteam,
+    playerestimatedmetrics,
+    synergyplaytypes,
+    teamplayeronoffsummary,
+)
 
 from . import config
 from .utils import (
     api_call_with_retry,
+    clear_checkpoint,
     get_all_team_ids,
+    get_team_abbreviations,
     get_team_name,
+    map_checkpointed,
     merge_measure_types,
     pace,
+    result_set_frames,
     save_dataframe,
+    shrink_dtypes,
 )
 
 logger = logging.getLogger("pipeline.fetch_supplementary")
 
+# Repeated‑string columns of the league‑wide fetches, stored as ``category``
+# (see :func:`utils.shrink_dtypes`); absent ones are skipped.
+_CATEGORICAL_COLUMNS = (
+    "SEASON_TYPE",
+    "TEAM_ABBREVIATION",
+    "TEAM_NAME",
+    "PLAYER_NAME",
+    "PLAY_TYPE",
+    "TYPE_GROUPING",
+    "PLAYER_OR_TEAM",
+    "PT_MEASURE_TYPE",
+    "DEFENSE_CATEGORY",
+)
+
 
 # =========================================================================
 # 1. On / Off court summary
@@ -34,8 +73,9 @@ logger = logging.getLogger("pipeline.fetch_supplementary")
 def fetch_on_off(season: str = config.SEASON) -> Optional[pd.DataFrame]:
     """Fetch on/off court player stats for all 30 teams.
 
-    Uses ``TeamPlayerOnOffSummary`` which requires a ``team_id``, so we loop
-    through every team.
+    Uses ``TeamPlayerOnOffSummary`` which requires a ``team_id``, so we make
+    one call per (team, season type) — 60 independent requests, fanned out
+    over :func:`utils.map_checkpointed` under the shared rate limiter.
 
     Args:
         season: NBA season string.
@@ -43,69 +83,68 @@ def fetch_on_off(season: str = config.SEASON) -> Optional[pd.DataFrame]:
     Returns:
         Combined on/off DataFrame, or ``None`` on total failure.
     """
-    from nba_api.stats.endpoints import teamplayeronoffsummary
-
     logger.info("Fetching on/off court data for season %s …", season)
-    all_frames: List[pd.DataFrame] = []
-    team_ids = get_all_team_ids()
+    tasks = list(product(get_all_team_ids(), config.SEASON_TYPES))
 
-    for idx, team_id in enumerate(team_ids, 1):
+    def _fetch(indexed: tuple) -> Optional[pd.DataFrame]:
+        idx, (team_id, season_type) = indexed
         team_name = get_team_name(team_id)
-        logger.info("  [%d/%d] %s (ID %d)", idx, len(team_ids), team_name, team_id)
-
-        for season_type in config.SEASON_TYPES:
-            try:
-                result = api_call_with_retry(
-                    teamplayeronoffsummary.TeamPlayerOnOffSummary,
-                    params=dict(
-                        team_id=team_id,
-                        season=season,
-                        season_type_all_star=season_type,
-                        measure_type_detailed_defense="Base",
-                        per_mode_detailed="Totals",
-                        last_n_games=0,
-                        month=0,
-                        opponent_team_id=0,
-                        pace_adjust="N",
-                        period=0,
-                        plus_minus="N",
-                        rank="N",
-                    ),
-                )
-                dfs = result.get_data_frames()
-
-                # dfs[1] = PlayersOnCourt, dfs[2] = PlayersOffCourt
-                if len(dfs) >= 3:
-                    on_court = dfs[1].copy()
-                    off_court = dfs[2].copy()
+        logger.info(
+            "  [%d/%d] %s (ID %d) | %s", idx, len(tasks), team_name, team_id, season_type
+        )
+        combined: Optional[pd.DataFrame] = None
+        try:
+            result = api_call_with_retry(
+                teamplayeronoffsummary.TeamPlayerOnOffSummary,
+                params=dict(
+                    team_id=team_id,
+                    season=season,
+                    season_type_all_star=season_type,
+                    measure_type_detailed_defense="Base",
+                    per_mode_detailed="Totals",
+                    last_n_games=0,
+                    month=0,
+                    opponent_team_id=0,
+                    pace_adjust="N",
+                    period=0,
+                    plus_minus="N",
+                    rank="N",
+                ),
+            )
+            # [1] = PlayersOnCourt, [2] = PlayersOffCourt; [0] (team overall) unused
+            dfs = result_set_frames(result, 1, 2)
+            if dfs is not None:
+                on_court, off_court = dfs
 
-                    on_court["COURT_STATUS"] = "On"
-                    off_court["COURT_STATUS"] = "Off"
+                on_court["COURT_STATUS"] = "On"
+                off_court["COURT_STATUS"] = "Off"
 
-                    combined = pd.concat([on_court, off_court], ignore_index=True)
-                    combined["team"] = team_name
-                    combined["SEASON_TYPE"] = season_type
-                    all_frames.append(combined)
+                combined = pd.concat([on_court, off_court], ignore_index=True)
+                combined["team"] = team_name
+                combined["SEASON_TYPE"] = season_type
 
-            except Exception as exc:
-                logger.error(
-                    "Failed on/off for %s (%s): %s", team_name, season_type, exc
-                )
+        except Exception as exc:
+            logger.error(
+                "Failed on/off for %s (%s): %s", team_name, season_type, exc
+            )
 
-            pace()
+        pace()
+        return combined
 
-        # Longer pause between teams
-        time.sleep(config.API_ENDPOINT_DELAY)
+    all_frames = map_checkpointed(
+        f"on_off_{season}", _fetch, list(enumerate(tasks, 1)), key=lambda it: it[1]
+    )
 
     # Filter out empty frames to avoid FutureWarning on concat
-    all_frames = [f for f in all_frames if not f.empty]
+    all_frames = [f for f in all_frames if f is not None and not f.empty]
     if not all_frames:
         logger.error("No on/off data collected.")
         return None
 
     df = pd.concat(all_frames, ignore_index=True)
     filepath = config.DATA_DIR / f"on_off_{season}.csv"
-    save_dataframe(df, filepath)
+    save_dataframe(df, filepath, twin=True)  # export_web reads this twice
+    clear_checkpoint(f"on_off_{season}")
     logger.info("✓ On/off data: %d rows → %s", len(df), filepath)
     return df
 
@@ -124,8 +163,6 @@ def fetch_clutch(season: str = config.SEASON) -> Optional[pd.DataFrame]:
     Returns:
         Clutch DataFrame or ``None``.
     """
-    from nba_api.stats.endpoints import leaguedashteamclutch
-
     logger.info("Fetching clutch data for season %s …", season)
     frames: List[pd.DataFrame] = []
 
@@ -150,7 +187,7 @@ def fetch_clutch(season: str = config.SEASON) -> Optional[pd.DataFrame]:
                     rank="N",
                 ),
             )
-            dfs = result.get_data_frames()
+            dfs = result_set_frames(result, 0)
             if dfs and not dfs[0].empty:
                 df = dfs[0]
                 df["SEASON_TYPE"] = season_type
@@ -188,78 +225,79 @@ def fetch_play_types(season: str = config.SEASON) -> Optional[pd.DataFrame]:
     Returns:
         Play‑type DataFrame or ``None``.
     """
-    from nba_api.stats.endpoints import synergyplaytypes
-
     logger.info("Fetching play‑type data for season %s …", season)
-    frames: List[pd.DataFrame] = []
 
     type_groupings = ["Offensive", "Defensive"]
     player_or_team_values = [("T", "Team"), ("P", "Player")]
 
-    total = (
-        len(config.SYNERGY_PLAY_TYPES)
-        * len(type_groupings)
-        * len(player_or_team_values)
-        * len(config.SEASON_TYPES)
+    tasks = list(
+        product(
+            config.SEASON_TYPES,
+            config.SYNERGY_PLAY_TYPES,
+            type_groupings,
+            player_or_team_values,
+        )
     )
-    call_idx = 0
 
-    for season_type in config.SEASON_TYPES:
-        for play_type in config.SYNERGY_PLAY_TYPES:
-            for tg in type_groupings:
-                for pt_abbr, pt_label in player_or_team_values:
-                    call_idx += 1
-                    logger.info(
-                        "  [%d/%d] %s | %s | %s | %s | %s",
-                        call_idx,
-                        total,
-                        season_type,
-                        play_type,
-                        tg,
-                        pt_label,
-                        season,
-                    )
-                    try:
-                        result = api_call_with_retry(
-                            synergyplaytypes.SynergyPlayTypes,
-                            params=dict(
-                                season=season,
-                                season_type_all_star=season_type,
-                                play_type_nullable=play_type,
-                                type_grouping_nullable=tg,
-                                player_or_team_abbreviation=pt_abbr,
-                                per_mode_simple="Totals",
-                                league_id="00",
-                            ),
-                        )
-                        dfs = result.get_data_frames()
-                        if dfs and not dfs[0].empty:
-                            df = dfs[0]
-                            df["PLAY_TYPE"] = play_type
-                            df["TYPE_GROUPING"] = tg
-                            df["PLAYER_OR_TEAM"] = pt_label
-                            df["SEASON_TYPE"] = season_type
-                            frames.append(df)
-                    except Exception as exc:
-                        logger.error(
-                            "Failed play‑type %s/%s/%s/%s: %s",
-                            play_type,
-                            tg,
-                            pt_label,
-                            season_type,
-                            exc,
-                        )
-                    pace()
+    def _fetch(indexed: tuple) -> Optional[pd.DataFrame]:
+        idx, (season_type, play_type, tg, (pt_abbr, pt_label)) = indexed
+        logger.info(
+            "  [%d/%d] %s | %s | %s | %s | %s",
+            idx,
+            len(tasks),
+            season_type,
+            play_type,
+            tg,
+            pt_label,
+            season,
+        )
+        df: Optional[pd.DataFrame] = None
+        try:
+            result = api_call_with_retry(
+                synergyplaytypes.SynergyPlayTypes,
+                params=dict(
+                    season=season,
+                    season_type_all_star=season_type,
+                    play_type_nullable=play_type,
+                    type_grouping_nullable=tg,
+                    player_or_team_abbreviation=pt_abbr,
+                    per_mode_simple="Totals",
+                    league_id="00",
+                ),
+            )
+            dfs = result_set_frames(result, 0)
+            if dfs and not dfs[0].empty:
+                df = dfs[0]
+                df["PLAY_TYPE"] = play_type
+                df["TYPE_GROUPING"] = tg
+                df["PLAYER_OR_TEAM"] = pt_label
+                df["SEASON_TYPE"] = season_type
+        except Exception as exc:
+            logger.error(
+                "Failed play‑type %s/%s/%s/%s: %s",
+                play_type,
+                tg,
+                pt_label,
+                season_type,
+                exc,
+            )
+        pace()
+        return df
+
+    frames = map_checkpointed(
+        f"play_types_{season}", _fetch, list(enumerate(tasks, 1)), key=lambda it: it[1]
+    )
 
     # Filter out empty frames to avoid FutureWarning on concat
-    frames = [f for f in frames if not f.empty]
+    frames = [f for f in frames if f is not None and not f.empty]
     if not frames:
         logger.error("No play‑type data collected.")
         return None
 
-    df = pd.concat(frames, ignore_index=True)
+    df = shrink_dtypes(pd.concat(frames, ignore_index=True, copy=False), _CATEGORICAL_COLUMNS)
     filepath = config.DATA_DIR / f"play_types_{season}.csv"
     save_dataframe(df, filepath)
+    clear_checkpoint(f"play_types_{season}")
     logger.info("✓ Play‑type data: %d rows → %s", len(df), filepath)
     return df
 
@@ -280,72 +318,66 @@ def fetch_hustle(
     Returns:
         ``(player_df, team_df)`` — either may be ``None`` on failure.
     """
-    from nba_api.stats.endpoints import leaguehustlestatsplayer, leaguehustlestatsteam
-
     logger.info("Fetching hustle stats for season %s …", season)
-    player_frames: List[pd.DataFrame] = []
-    team_frames: List[pd.DataFrame] = []
-
-    for season_type in config.SEASON_TYPES:
-        # Players
+    endpoints = [
+        ("players", leaguehustlestatsplayer.LeagueHustleStatsPlayer),
+        ("teams", leaguehustlestatsteam.LeagueHustleStatsTeam),
+    ]
+    tasks = list(product(config.SEASON_TYPES, endpoints))
+
+    def _fetch(task: tuple) -> Optional[pd.DataFrame]:
+        season_type, (level, endpoint_cls) = task
+        df: Optional[pd.DataFrame] = None
         try:
             result = api_call_with_retry(
-                leaguehustlestatsplayer.LeagueHustleStatsPlayer,
+                endpoint_cls,
                 params=dict(
                     season=season,
                     season_type_all_star=season_type,
                     per_mode_time="Totals",
                 ),
             )
-            dfs = result.get_data_frames()
+            dfs = result_set_frames(result, 0)
             if dfs and not dfs[0].empty:
                 df = dfs[0]
                 df["SEASON_TYPE"] = season_type
-                player_frames.append(df)
-                logger.info("  Hustle players (%s): %d rows", season_type, len(df))
+                logger.info("  Hustle %s (%s): %d rows", level, season_type, len(df))
         except Exception as exc:
-            logger.error("Failed hustle players (%s): %s", season_type, exc)
+            logger.error("Failed hustle %s (%s): %s", level, season_type, exc)
         pace()
+        return df
 
-        # Teams
-        try:
-            result = api_call_with_retry(
-                leaguehustlestatsteam.LeagueHustleStatsTeam,
-                params=dict(
-                    season=season,
-                    season_type_all_star=season_type,
-                    per_mode_time="Totals",
-                ),
-            )
-            dfs = result.get_data_frames()
-            if dfs and not dfs[0].empty:
-                df = dfs[0]
-                df["SEASON_TYPE"] = season_type
-                team_frames.append(df)
-                logger.info("  Hustle teams (%s): %d rows", season_type, len(df))
-        except Exception as exc:
-            logger.error("Failed hustle teams (%s): %s", season_type, exc)
-        pace()
+    fetched = map_checkpointed(
+        f"hustle_{season}", _fetch, tasks, key=lambda t: (t[0], t[1][0])
+    )
+    player_frames = [df for (_, (level, _)), df in zip(tasks, fetched) if level == "players"]
+    team_frames = [df for (_, (level, _)), df in zip(tasks, fetched) if level == "teams"]
 
     player_df: Optional[pd.DataFrame] = None
     team_df: Optional[pd.DataFrame] = None
 
     # Filter out empty frames to avoid FutureWarning on concat
-    player_frames = [f for f in player_frames if not f.empty]
-    team_frames = [f for f in team_frames if not f.empty]
+    player_frames = [f for f in player_frames if f is not None and not f.empty]
+    team_frames = [f for f in team_frames if f is not None and not f.empty]
 
     if player_frames:
-        player_df = pd.concat(player_frames, ignore_index=True)
+        player_df = shrink_dtypes(
+            pd.concat(player_frames, ignore_index=True, copy=False), _CATEGORICAL_COLUMNS
+        )
         save_dataframe(player_df, config.DATA_DIR / f"hustle_players_{season}.csv")
         logger.info("✓ Hustle players: %d rows", len(player_df))
 
     if team_frames:
-        team_df = pd.concat(team_frames, ignore_index=True)
+        team_df = shrink_dtypes(
+            pd.concat(team_frames, ignore_index=True, copy=False), _CATEGORICAL_COLUMNS
+        )
         save_dataframe(team_df, config.DATA_DIR / f"hustle_teams_{season}.csv")
         logger.info("✓ Hustle teams: %d rows", len(team_df))
 
     if player_df is None and team_df is None:
         logger.error("No hustle data collected.")
+    else:
+        clear_checkpoint(f"hustle_{season}")
 
     return player_df, team_df
 
@@ -364,62 +396,58 @@ def fetch_tracking(season: str = config.SEASON) -> Optional[pd.DataFrame]:
     Returns:
         Concatenated tracking DataFrame or ``None``.
     """
-    from nba_api.stats.endpoints import leaguedashptstats
-
     logger.info("Fetching tracking stats for season %s …", season)
-    frames: List[pd.DataFrame] = []
 
     player_or_team_values = [("Player", "Player"), ("Team", "Team")]
-    total = (
-        len(config.PT_MEASURE_TYPES)
-        * len(player_or_team_values)
-        * len(config.SEASON_TYPES)
-    )
-    call_idx = 0
+    tasks = list(product(config.SEASON_TYPES, config.PT_MEASURE_TYPES, player_or_team_values))
 
-    for season_type in config.SEASON_TYPES:
-        for pt_measure in config.PT_MEASURE_TYPES:
-            for pot_param, pot_label in player_or_team_values:
-                call_idx += 1
-                logger.info(
-                    "  [%d/%d] %s | %s | %s", call_idx, total, pt_measure, pot_label, season_type
-                )
-                try:
-                    result = api_call_with_retry(
-                        leaguedashptstats.LeagueDashPtStats,
-                        params=dict(
-                            season=season,
-                            season_type_all_star=season_type,
-                            pt_measure_type=pt_measure,
-                            player_or_team=pot_param,
-                            per_mode_simple="Totals",
-                            last_n_games=0,
-                            month=0,
-                            opponent_team_id=0,
-                        ),
-                    )
-                    dfs = result.get_data_frames()
-                    if dfs and not dfs[0].empty:
-                        df = dfs[0]
-                        df["PT_MEASURE_TYPE"] = pt_measure
-                        df["PLAYER_OR_TEAM"] = pot_label
-                        df["SEASON_TYPE"] = season_type
-                        frames.append(df)
-                except Exception as exc:
-                    logger.error(
-                        "Failed tracking %s/%s/%s: %s", pt_measure, pot_label, season_type, exc
-                    )
-                pace()
+    def _fetch(indexed: tuple) -> Optional[pd.DataFrame]:
+        idx, (season_type, pt_measure, (pot_param, pot_label)) = indexed
+        logger.info(
+            "  [%d/%d] %s | %s | %s", idx, len(tasks), pt_measure, pot_label, season_type
+        )
+        df: Optional[pd.DataFrame] = None
+        try:
+            result = api_call_with_retry(
+                leaguedashptstats.LeagueDashPtStats,
+                params=dict(
+                    season=season,
+                    season_type_all_star=season_type,
+                    pt_measure_type=pt_measure,
+                    player_or_team=pot_param,
+                    per_mode_simple="Totals",
+                    last_n_games=0,
+                    month=0,
+                    opponent_team_id=0,
+                ),
+            )
+            dfs = result_set_frames(result, 0)
+            if dfs and not dfs[0].empty:
+                df = dfs[0]
+                df["PT_MEASURE_TYPE"] = pt_measure
+                df["PLAYER_OR_TEAM"] = pot_label
+                df["SEASON_TYPE"] = season_type
+        except Exception as exc:
+            logger.error(
+                "Failed tracking %s/%s/%s: %s", pt_measure, pot_label, season_type, exc
+            )
+        pace()
+        return df
+
+    frames = map_checkpointed(
+        f"tracking_{season}", _fetch, list(enumerate(tasks, 1)), key=lambda it: it[1]
+    )
 
     # Filter out empty frames to avoid FutureWarning on concat
-    frames = [f for f in frames if not f.empty]
+    frames = [f for f in frames if f is not None and not f.empty]
     if not frames:
         logger.error("No tracking data collected.")
         return None
 
-    df = pd.concat(frames, ignore_index=True)
+    df = shrink_dtypes(pd.concat(frames, ignore_index=True, copy=False), _CATEGORICAL_COLUMNS)
     filepath = config.DATA_DIR / f"tracking_{season}.csv"
     save_dataframe(df, filepath)
+    clear_checkpoint(f"tracking_{season}")
     logger.info("✓ Tracking data: %d rows → %s", len(df), filepath)
     return df
 
@@ -438,48 +466,48 @@ def fetch_defense_tracking(season: str = config.SEASON) -> Optional[pd.DataFrame
     Returns:
         Concatenated defense‑tracking DataFrame or ``None``.
     """
-    from nba_api.stats.endpoints import leaguedashptdefend
-
     logger.info("Fetching defense tracking for season %s …", season)
-    frames: List[pd.DataFrame] = []
+    tasks = list(product(config.SEASON_TYPES, config.DEFENSE_CATEGORIES))
 
-    total = len(config.DEFENSE_CATEGORIES) * len(config.SEASON_TYPES)
-    call_idx = 0
+    def _fetch(indexed: tuple) -> Optional[pd.DataFrame]:
+        idx, (season_type, category) = indexed
+        logger.info("  [%d/%d] %s | %s", idx, len(tasks), category, season_type)
+        df: Optional[pd.DataFrame] = None
+        try:
+            result = api_call_with_retry(
+                leaguedashptdefend.LeagueDashPtDefend,
+                params=dict(
+                    season=season,
+                    season_type_all_star=season_type,
+                    defense_category=category,
+                    per_mode_simple="Totals",
+                    league_id="00",
+                ),
+            )
+            dfs = result_set_frames(result, 0)
+            if dfs and not dfs[0].empty:
+                df = dfs[0]
+                df["DEFENSE_CATEGORY"] = category
+                df["SEASON_TYPE"] = season_type
+        except Exception as exc:
+            logger.error("Failed defense tracking %s/%s: %s", category, season_type, exc)
+        pace()
+        return df
 
-    for season_type in config.SEASON_TYPES:
-        for category in config.DEFENSE_CATEGORIES:
-            call_idx += 1
-            logger.info("  [%d/%d] %s | %s", call_idx, total, category, season_type)
-            try:
-                result = api_call_with_retry(
-                    leaguedashptdefend.LeagueDashPtDefend,
-                    params=dict(
-                        season=season,
-                        season_type_all_star=season_type,
-                        defense_category=category,
-                        per_mode_simple="Totals",
-                        league_id="00",
-                    ),
-                )
-                dfs = result.get_data_frames()
-                if dfs and not dfs[0].empty:
-                    df = dfs[0]
-                    df["DEFENSE_CATEGORY"] = category
-                    df["SEASON_TYPE"] = season_type
-                    frames.append(df)
-            except Exception as exc:
-                logger.error("Failed defense tracking %s/%s: %s", category, season_type, exc)
-            pace()
+    frames = map_checkpointed(
+        f"defense_tracking_{season}", _fetch, list(enumerate(tasks, 1)), key=lambda it: it[1]
+    )
 
     # Filter out empty frames to avoid FutureWarning on concat
-    frames = [f for f in frames if not f.empty]
+    frames = [f for f in frames if f is not None and not f.empty]
     if not frames:
         logger.error("No defense tracking data collected.")
         return None
 
-    df = pd.concat(frames, ignore_index=True)
+    df = shrink_dtypes(pd.concat(frames, ignore_index=True, copy=False), _CATEGORICAL_COLUMNS)
     filepath = config.DATA_DIR / f"defense_tracking_{season}.csv"
     save_dataframe(df, filepath)
+    clear_checkpoint(f"defense_tracking_{season}")
     logger.info("✓ Defense tracking: %d rows → %s", len(df), filepath)
     return df
 
@@ -498,12 +526,10 @@ def fetch_estimated_metrics(season: str = config.SEASON) -> Optional[pd.DataFram
     Returns:
         Estimated‑metrics DataFrame or ``None``.
     """
-    from nba_api.stats.endpoints import playerestimatedmetrics
-
     logger.info("Fetching estimated metrics for season %s …", season)
-    frames: List[pd.DataFrame] = []
 
-    for season_type in config.SEASON_TYPES:
+    def _fetch(season_type: str) -> Optional[pd.DataFrame]:
+        df: Optional[pd.DataFrame] = None
         try:
             result = api_call_with_retry(
                 playerestimatedmetrics.PlayerEstimatedMetrics,
@@ -513,25 +539,28 @@ def fetch_estimated_metrics(season: str = config.SEASON) -> Optional[pd.DataFram
                     league_id="00",
                 ),
             )
-            dfs = result.get_data_frames()
+            dfs = result_set_frames(result, 0)
             if dfs and not dfs[0].empty:
                 df = dfs[0]
                 df["SEASON_TYPE"] = season_type
-                frames.append(df)
                 logger.info("  Estimated metrics (%s): %d rows", season_type, len(df))
         except Exception as exc:
             logger.error("Failed estimated metrics (%s): %s", season_type, exc)
         pace()
+        return df
+
+    frames = map_checkpointed(f"estimated_metrics_{season}", _fetch, config.SEASON_TYPES)
 
     # Filter out empty frames to avoid FutureWarning on concat
-    frames = [f for f in frames if not f.empty]
+    frames = [f for f in frames if f is not None and not f.empty]
     if not frames:
         logger.error("No estimated metrics collected.")
         return None
 
-    df = pd.concat(frames, ignore_index=True)
+    df = shrink_dtypes(pd.concat(frames, ignore_index=True, copy=False), _CATEGORICAL_COLUMNS)
     filepath = config.DATA_DIR / f"estimated_metrics_{season}.csv"
     save_dataframe(df, filepath)
+    clear_checkpoint(f"estimated_metrics_{season}")
     logger.info("✓ Estimated metrics: %d rows → %s", len(df), filepath)
     return df
 
@@ -554,8 +583,6 @@ def fetch_player_stats(season: str = config.SEASON) -> Optional[pd.DataFrame]:
     Returns:
         Combined player-stats DataFrame, or ``None`` on total failure.
     """
-    from nba_api.stats.endpoints import leaguedashplayerstats
-
     logger.info("Fetching player stats for season %s …", season)
     frames: List[pd.DataFrame] = []
 
@@ -579,7 +606,7 @@ def fetch_player_stats(season: str = config.SEASON) -> Optional[pd.DataFrame]:
                         rank="N",
                     ),
                 )
-                dfs = result.get_data_frames()
+                dfs = result_set_frames(result, 0)
                 if dfs and not dfs[0].empty:
                     by_measure[measure] = dfs[0]
                     logger.info("  %s | %s: %d rows", season_type, measure, len(dfs[0]))
@@ -602,7 +629,7 @@ def fetch_player_stats(season: str = config.SEASON) -> Optional[pd.DataFrame]:
 
     df = pd.concat(frames, ignore_index=True)
     filepath = config.DATA_DIR / f"player_stats_{season}.csv"
-    save_dataframe(df, filepath)
+    save_dataframe(df, filepath, twin=True)  # re-read by export_player_index
     logger.info("✓ Player stats: %d rows × %d cols → %s", len(df), len(df.columns), filepath)
     return df
 
@@ -624,8 +651,6 @@ def fetch_team_stats(season: str = config.SEASON) -> Optional[pd.DataFrame]:
     Returns:
         Combined team-stats DataFrame, or ``None`` on total failure.
     """
-    from nba_api.stats.endpoints import leaguedashteamstats
-
     logger.info("Fetching team stats for season %s …", season)
     frames: List[pd.DataFrame] = []
 
@@ -649,7 +674,7 @@ def fetch_team_stats(season: str = config.SEASON) -> Optional[pd.DataFrame]:
                         rank="N",
                     ),
                 )
-                dfs = result.get_data_frames()
+                dfs = result_set_frames(result, 0)
                 if dfs and not dfs[0].empty:
                     by_measure[measure] = dfs[0]
                     logger.info("  %s | %s: %d rows", season_type, measure, len(dfs[0]))
@@ -672,7 +697,7 @@ def fetch_team_stats(season: str = config.SEASON) -> Optional[pd.DataFrame]:
 
     df = pd.concat(frames, ignore_index=True)
     filepath = config.DATA_DIR / f"team_stats_{season}.csv"
-    save_dataframe(df, filepath)
+    save_dataframe(df, filepath, twin=True)  # re-read by export_player_index
     logger.info("✓ Team stats: %d rows × %d cols → %s", len(df), len(df.columns), filepath)
     return df
 
@@ -696,8 +721,6 @@ def fetch_player_clutch(season: str = config.SEASON) -> Optional[pd.DataFrame]:
     Returns:
         Combined player-clutch DataFrame, or ``None`` on total failure.
     """
-    from nba_api.stats.endpoints import leaguedashplayerclutch
-
     logger.info("Fetching player clutch stats for season %s …", season)
     frames: List[pd.DataFrame] = []
 
@@ -724,7 +747,7 @@ def fetch_player_clutch(season: str = config.SEASON) -> Optional[pd.DataFrame]:
                         rank="N",
                     ),
                 )
-                dfs = result.get_data_frames()
+                dfs = result_set_frames(result, 0)
                 if dfs and not dfs[0].empty:
                     by_measure[measure] = dfs[0]
                     logger.info("  %s | %s: %d rows", season_type, measure, len(dfs[0]))
@@ -747,7 +770,7 @@ def fetch_player_clutch(season: str = config.SEASON) -> Optional[pd.DataFrame]:
 
     df = pd.concat(frames, ignore_index=True)
     filepath = config.DATA_DIR / f"player_clutch_{season}.csv"
-    save_dataframe(df, filepath)
+    save_dataframe(df, filepath, twin=True)  # re-read by export_player_index
     logger.info("✓ Player clutch: %d rows × %d cols → %s", len(df), len(df.columns), filepath)
     return df
 
@@ -801,8 +824,6 @@ def fetch_shot_zones(season: str = config.SEASON) -> Optional[pd.DataFrame]:
     Returns:
         Combined shot-zone DataFrame, or ``None`` on total failure.
     """
-    from nba_api.stats.endpoints import leaguedashplayershotlocations
-
     logger.info("Fetching player shot zones for season %s …", season)
     frames: List[pd.DataFrame] = []
 
@@ -824,7 +845,7 @@ def fetch_shot_zones(season: str = config.SEASON) -> Optional[pd.DataFrame]:
                     rank="N",
                 ),
             )
-            dfs = result.get_data_frames()
+            dfs = result_set_frames(result, 0)
             if dfs and not dfs[0].empty:
                 df = _flatten_shot_zone_columns(dfs[0])
                 df["SEASON_TYPE"] = season_type
@@ -841,7 +862,7 @@ def fetch_shot_zones(season: str = config.SEASON) -> Optional[pd.DataFrame]:
 
     df = pd.concat(frames, ignore_index=True)
     filepath = config.DATA_DIR / f"shot_zones_{season}.csv"
-    save_dataframe(df, filepath)
+    save_dataframe(df, filepath, twin=True)  # re-read by export_player_index
     logger.info("✓ Shot zones: %d rows × %d cols → %s", len(df), len(df.columns), filepath)
     return df
 
@@ -885,8 +906,6 @@ def fetch_player_game_logs(season: str = config.SEASON) -> Optional[pd.DataFrame
     Returns:
         Combined game-log DataFrame, or ``None`` on total failure.
     """
-    from nba_api.stats.endpoints import leaguegamelog
-
     logger.info("Fetching player game logs for season %s …", season)
     frames: List[pd.DataFrame] = []
 
@@ -902,7 +921,7 @@ def fetch_player_game_logs(season: str = config.SEASON) -> Optional[pd.DataFrame
                     direction="ASC",
                 ),
             )
-            dfs = result.get_data_frames()
+            dfs = result_set_frames(result, 0)
             if dfs and not dfs[0].empty:
                 df = dfs[0]
                 keep = [c for c in GAME_LOG_COLUMNS if c in df.columns]
@@ -962,8 +981,6 @@ def fetch_team_game_logs(season: str = config.SEASON) -> Optional[pd.DataFrame]:
     Returns:
         Combined team game-log DataFrame, or ``None`` on total failure.
     """
-    from nba_api.stats.endpoints import leaguegamelog
-
     logger.info("Fetching team game logs for season %s …", season)
     frames: List[pd.DataFrame] = []
 
@@ -979,7 +996,7 @@ def fetch_team_game_logs(season: str = config.SEASON) -> Optional[pd.DataFrame]:
                     direction="ASC",
                 ),
             )
-            dfs = result.get_data_frames()
+            dfs = result_set_frames(result, 0)
             if dfs and not dfs[0].empty:
                 df = dfs[0]
                 keep = [c for c in TEAM_GAME_LOG_COLUMNS if c in df.columns]
@@ -1032,8 +1049,6 @@ def fetch_pt_shot(season: str = config.SEASON) -> Optional[pd.DataFrame]:
     Returns:
         Combined shot-split DataFrame, or ``None`` on total failure.
     """
-    from nba_api.stats.endpoints import leaguedashplayerptshot
-
     logger.info("Fetching closest-defender shot splits for season %s …", season)
     frames: List[pd.DataFrame] = []
 
@@ -1050,7 +1065,7 @@ def fetch_pt_shot(season: str = config.SEASON) -> Optional[pd.DataFrame]:
                         league_id="00",
                     ),
                 )
-                dfs = result.get_data_frames()
+                dfs = result_set_frames(result, 0)
                 if dfs and not dfs[0].empty:
                     df = dfs[0]
                     keep = [c for c in PT_SHOT_COLUMNS if c in df.columns]
@@ -1182,10 +1197,10 @@ def fetch_standings(season: str = config.SEASON) -> Optional[pd.DataFrame]:
 
     Slim, one row per team: conference + seed, W/L/PCT, home/road/L10 splits,
     current streak and games back. Team abbreviation is joined from nba_api's
-    static team table (the endpoint returns only id + city + name).
+    static team table via :func:`utils.get_team_abbreviations` (the endpoint
+    returns only id + city + name).
     """
     from .fetch_rapm import _get_json
-    from nba_api.stats.static import teams as _static_teams
 
     logger.info("Fetching standings for season %s …", season)
     try:
@@ -1200,8 +1215,7 @@ def fetch_standings(season: str = config.SEASON) -> Optional[pd.DataFrame]:
         df = pd.DataFrame(rs["rowSet"], columns=rs["headers"])
         keep = [c for c in STANDINGS_COLUMNS if c in df.columns]
         df = df[keep].rename(columns={"strCurrentStreak": "STREAK", "ConferenceGamesBack": "GB"})
-        abbr = {t["id"]: t["abbreviation"] for t in _static_teams.get_teams()}
-        df["TEAM_ABBREVIATION"] = df["TeamID"].map(abbr)
+        df["TEAM_ABBREVIATION"] = df["TeamID"].map(get_team_abbreviations())
         df["SEASON_TYPE"] = "Regular Season"
     except Exception as exc:
         logger.error("Failed standings %s: %s", season, exc)
@@ -14,16 +14,42 @@ from typing import Dict, List, Tuple
 
 from . import config
 from . import nba_http_patch  # noqa: F401  — applies curl_cffi (Chrome TLS) patch on import
-from .utils import get_api_call_count, health_check, setup_logging
+from .utils import (
+    drain_pending_writes,
+    get_api_call_count,
+    health_check,
+    setup_logging,
+    warm_up_connections,
+)
 
 logger = logging.getLogger("pipeline.main")
 
+# Log separator bars (section headers / run banner and summary).
+_BAR_HEAVY = "━" * 60
+_BAR_EQ = "=" * 60
+
 
 # ---------------------------------------------------------------------------
 # Section runner
 # ---------------------------------------------------------------------------
 
 
+def _count_rows(result) -> int:
+    """Total rows in a section's return value.
+
+    Handles a DataFrame, ``{gq: df}`` (fetch_and_merge_lineups) and
+    ``(player_df, team_df)`` (fetch_hustle); ``None`` parts count as 0.
+    ``len()`` of a DataFrame is O(1), so no data is scanned.
+    """
+    if result is None:
+        return 0
+    if isinstance(result, dict):
+        result = tuple(result.values())
+    if isinstance(result, tuple):
+        return sum(_count_rows(part) for part in result)
+    return len(result) if hasattr(result, "__len__") else 0
+
+
 def _run_section(
     name: str,
     fn,  # Callable — deliberately untyped to avoid generics noise
@@ -44,28 +70,15 @@ def _run_section(
     Returns:
         ``(True, row_count)`` on success, ``(False, 0)`` on failure.
     """
-    logger.info("━" * 60)
+    logger.info(_BAR_HEAVY)
     logger.info("SECTION: %s", name)
-    logger.info("━" * 60)
+    logger.info(_BAR_HEAVY)
     start = time.time()
     try:
         result = fn(*args, **kwargs)
         elapsed = time.time() - start
 
-        # Count rows in the result
-        rows = 0
-        if result is None:
-            rows = 0
-        elif isinstance(result, dict):
-            # fetch_and_merge_lineups returns {gq: df}
-            import pandas as pd
-            rows = sum(len(v) for v in result.values() if isinstance(v, pd.DataFrame))
-        elif isinstance(result, tuple):
-            # fetch_hustle returns (player_df, team_df)
-            import pandas as pd
-            rows = sum(len(v) for v in result if isinstance(v, pd.DataFrame))
-        else:
-            rows = len(result) if hasattr(result, "__len__") else 0
+        rows = _count_rows(result)
 
         if rows > 0:
             logger.info("✓ %s completed in %.1fs — %d rows", name, elapsed, rows)
@@ -103,9 +116,9 @@ def _print_summary(
     failed = [k for k, (s, _) in results.items() if not s]
 
     logger.info("")
-    logger.info("=" * 60)
+    logger.info(_BAR_EQ)
     logger.info("PIPELINE SUMMARY")
-    logger.info("=" * 60)
+    logger.info(_BAR_EQ)
     logger.info("Total wall time    : %.1f s (%.1f min)", wall_seconds, wall_seconds / 60)
     logger.info("Total API calls    : %d", api_calls)
     logger.info("Total rows fetched : %d", total_rows)
@@ -124,7 +137,18 @@ def _print_summary(
         for f in failed:
             logger.info("    • %s", f)
 
-    logger.info("=" * 60)
+    logger.info(_BAR_EQ)
+
+
+def _pause_after(ok: bool) -> None:
+    """Back off before the next section, but only after this one failed.
+
+    Healthy sections need no gap — the shared rate limiter already spaces
+    every call — so the ``API_ENDPOINT_DELAY`` pause is kept only as a
+    cool‑down after a failure.
+    """
+    if not ok:
+        time.sleep(config.API_ENDPOINT_DELAY)
 
 
 # ---------------------------------------------------------------------------
@@ -169,6 +193,11 @@ def _parse_args(argv: list | None = None) -> argparse.Namespace:
         action="store_true",
         help="Compute RAPM and re-export the player index; skip everything else.",
     )
+    parser.add_argument(
+        "--use-cache",
+        action="store_true",
+        help="Reuse fresh on-disk API responses (data/api_cache) and cache new ones.",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -201,9 +230,9 @@ def run(argv: list | None = None) -> None:
 
     season: str = args.season
 
-    logger.info("=" * 60)
+    logger.info(_BAR_EQ)
     logger.info("NBA DATA PIPELINE — season %s", season)
-    logger.info("=" * 60)
+    logger.info(_BAR_EQ)
 
     # --- Health check ---
     if not health_check(season):
@@ -216,9 +245,23 @@ def run(argv: list | None = None) -> None:
         logger.info("Dry‑run complete — API is reachable. Exiting.")
         return
 
+    # Open the API workers' kept-alive connections once, up front.
+    warmed = warm_up_connections()
+    if warmed:
+        logger.info("Warmed up %d API connections.", warmed)
+
+    # health_check() bypasses the cache itself; --use-cache just switches it on
+    # for the fetches that follow.
+    if args.use_cache:
+        config.API_CACHE_ENABLED = True
+        logger.info("API response cache enabled (%s)", config.API_CACHE_DIR)
+
     wall_start = time.time()
     results: Dict[str, Tuple[bool, int]] = {}
     files_written: List[str] = []
+    # Fetch outputs → section; they're queued for writing, so only listed in
+    # files_written once the writes are known to have landed.
+    written_by: Dict[str, str] = {}
 
     # ------------------------------------------------------------------
     # Core lineups
@@ -230,10 +273,9 @@ def run(argv: list | None = None) -> None:
         results["Lineups"] = (ok, rows)
         if ok:
             for gq in config.GROUP_QUANTITIES:
-                files_written.append(str(config.DATA_DIR / f"lineups_{gq}man_{season}.csv"))
+                written_by[str(config.DATA_DIR / f"lineups_{gq}man_{season}.csv")] = "Lineups"
 
-        # Pause before supplementary
-        time.sleep(config.API_ENDPOINT_DELAY)
+        _pause_after(ok)
 
     # ------------------------------------------------------------------
     # Supplementary data
@@ -262,113 +304,123 @@ def run(argv: list | None = None) -> None:
         ok, rows = _run_section("On/Off Court", fetch_on_off, season)
         results["On/Off"] = (ok, rows)
         if ok:
-            files_written.append(str(config.DATA_DIR / f"on_off_{season}.csv"))
-        time.sleep(config.API_ENDPOINT_DELAY)
+            written_by[str(config.DATA_DIR / f"on_off_{season}.csv")] = "On/Off"
+        _pause_after(ok)
 
         # 2. Clutch
         ok, rows = _run_section("Clutch", fetch_clutch, season)
         results["Clutch"] = (ok, rows)
         if ok:
-            files_written.append(str(config.DATA_DIR / f"clutch_{season}.csv"))
-        time.sleep(config.API_ENDPOINT_DELAY)
+            written_by[str(config.DATA_DIR / f"clutch_{season}.csv")] = "Clutch"
+        _pause_after(ok)
 
         # 3. Play Types
         ok, rows = _run_section("Play Types", fetch_play_types, season)
         results["Play Types"] = (ok, rows)
         if ok:
-            files_written.append(str(config.DATA_DIR / f"play_types_{season}.csv"))
-        time.sleep(config.API_ENDPOINT_DELAY)
+            written_by[str(config.DATA_DIR / f"play_types_{season}.csv")] = "Play Types"
+        _pause_after(ok)
 
         # 4. Hustle
         ok, rows = _run_section("Hustle Stats", fetch_hustle, season)
         results["Hustle"] = (ok, rows)
         if ok:
-            files_written.append(str(config.DATA_DIR / f"hustle_players_{season}.csv"))
-            files_written.append(str(config.DATA_DIR / f"hustle_teams_{season}.csv"))
-        time.sleep(config.API_ENDPOINT_DELAY)
+            written_by[str(config.DATA_DIR / f"hustle_players_{season}.csv")] = "Hustle"
+            written_by[str(config.DATA_DIR / f"hustle_teams_{season}.csv")] = "Hustle"
+        _pause_after(ok)
 
         # 5. Tracking
         ok, rows = _run_section("Player Tracking", fetch_tracking, season)
         results["Tracking"] = (ok, rows)
         if ok:
-            files_written.append(str(config.DATA_DIR / f"tracking_{season}.csv"))
-        time.sleep(config.API_ENDPOINT_DELAY)
+            written_by[str(config.DATA_DIR / f"tracking_{season}.csv")] = "Tracking"
+        _pause_after(ok)
 
         # 6. Defense Tracking
         ok, rows = _run_section("Defense Tracking", fetch_defense_tracking, season)
         results["Defense Tracking"] = (ok, rows)
         if ok:
-            files_written.append(str(config.DATA_DIR / f"defense_tracking_{season}.csv"))
-        time.sleep(config.API_ENDPOINT_DELAY)
+            written_by[str(config.DATA_DIR / f"defense_tracking_{season}.csv")] = "Defense Tracking"
+        _pause_after(ok)
 
         # 7. Estimated Metrics
         ok, rows = _run_section("Estimated Metrics", fetch_estimated_metrics, season)
         results["Estimated Metrics"] = (ok, rows)
         if ok:
-            files_written.append(str(config.DATA_DIR / f"estimated_metrics_{season}.csv"))
-        time.sleep(config.API_ENDPOINT_DELAY)
+            written_by[str(config.DATA_DIR / f"estimated_metrics_{season}.csv")] = "Estimated Metrics"
+        _pause_after(ok)
 
         # 8. Player Stats (Base + Advanced)
         ok, rows = _run_section("Player Stats", fetch_player_stats, season)
         results["Player Stats"] = (ok, rows)
         if ok:
-            files_written.append(str(config.DATA_DIR / f"player_stats_{season}.csv"))
-        time.sleep(config.API_ENDPOINT_DELAY)
+            written_by[str(config.DATA_DIR / f"player_stats_{season}.csv")] = "Player Stats"
+        _pause_after(ok)
 
         # 9. Team Stats (Base + Advanced + Four Factors)
         ok, rows = _run_section("Team Stats", fetch_team_stats, season)
         results["Team Stats"] = (ok, rows)
         if ok:
-            files_written.append(str(config.DATA_DIR / f"team_stats_{season}.csv"))
-        time.sleep(config.API_ENDPOINT_DELAY)
+            written_by[str(config.DATA_DIR / f"team_stats_{season}.csv")] = "Team Stats"
+        _pause_after(ok)
 
         # 10. Player Clutch (Base + Advanced)
         ok, rows = _run_section("Player Clutch", fetch_player_clutch, season)
         results["Player Clutch"] = (ok, rows)
         if ok:
-            files_written.append(str(config.DATA_DIR / f"player_clutch_{season}.csv"))
-        time.sleep(config.API_ENDPOINT_DELAY)
+            written_by[str(config.DATA_DIR / f"player_clutch_{season}.csv")] = "Player Clutch"
+        _pause_after(ok)
 
         # 11. Shot Zones (LeagueDashPlayerShotLocations — By Zone)
         ok, rows = _run_section("Shot Zones", fetch_shot_zones, season)
         results["Shot Zones"] = (ok, rows)
         if ok:
-            files_written.append(str(config.DATA_DIR / f"shot_zones_{season}.csv"))
-        time.sleep(config.API_ENDPOINT_DELAY)
+            written_by[str(config.DATA_DIR / f"shot_zones_{season}.csv")] = "Shot Zones"
+        _pause_after(ok)
 
         # 12. Player Game Logs (game-by-game, for season-trend charts)
         ok, rows = _run_section("Player Game Logs", fetch_player_game_logs, season)
         results["Player Game Logs"] = (ok, rows)
         if ok:
-            files_written.append(str(config.DATA_DIR / f"player_game_logs_{season}.csv"))
-        time.sleep(config.API_ENDPOINT_DELAY)
+            written_by[str(config.DATA_DIR / f"player_game_logs_{season}.csv")] = "Player Game Logs"
+        _pause_after(ok)
 
         # 13. Team Game Logs (team-level, for the team season-trend chart)
         ok, rows = _run_section("Team Game Logs", fetch_team_game_logs, season)
         results["Team Game Logs"] = (ok, rows)
         if ok:
-            files_written.append(str(config.DATA_DIR / f"team_game_logs_{season}.csv"))
-        time.sleep(config.API_ENDPOINT_DELAY)
+            written_by[str(config.DATA_DIR / f"team_game_logs_{season}.csv")] = "Team Game Logs"
+        _pause_after(ok)
 
         # 14. Closest-defender shot splits (for shot-making over expected)
         ok, rows = _run_section("Shot Splits", fetch_pt_shot, season)
         results["Shot Splits"] = (ok, rows)
         if ok:
-            files_written.append(str(config.DATA_DIR / f"pt_shot_defender_{season}.csv"))
-        time.sleep(config.API_ENDPOINT_DELAY)
+            written_by[str(config.DATA_DIR / f"pt_shot_defender_{season}.csv")] = "Shot Splits"
+        _pause_after(ok)
 
         # 15. Defensive matchups (who guards whom, for the profile matchup card)
         ok, rows = _run_section("Matchups", fetch_matchups, season)
         results["Matchups"] = (ok, rows)
         if ok:
-            files_written.append(str(config.DATA_DIR / f"matchups_{season}.csv"))
-        time.sleep(config.API_ENDPOINT_DELAY)
+            written_by[str(config.DATA_DIR / f"matchups_{season}.csv")] = "Matchups"
+        _pause_after(ok)
 
         # 16. League standings (final conference table)
         ok, rows = _run_section("Standings", fetch_standings, season)
         results["Standings"] = (ok, rows)
         if ok:
-            files_written.append(str(config.DATA_DIR / f"standings_{season}.csv"))
+            written_by[str(config.DATA_DIR / f"standings_{season}.csv")] = "Standings"
+
+    # Everything below re-reads files the fetch sections queued for writing.
+    # A section whose output write failed counts as failed, like a fetch error.
+    failed_writes = {str(p) for p in drain_pending_writes()}
+    for path, section in written_by.items():
+        if path in failed_writes:
+            logger.error("✗ %s: writing %s failed", section, path)
+            results[section] = (False, 0)
+        else:
+            files_written.append(path)
 
     # ------------------------------------------------------------------
     # RAPM — self-computed regularized adjusted plus-minus. Heavy (reconstructs
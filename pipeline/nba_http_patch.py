@@ -12,20 +12,55 @@ exactly that. nba_api's ``library/http.py`` does ``import requests`` and then
 ``impersonate="chrome"``. curl_cffi's Response is API-compatible (``.text``,
 ``.status_code``, ``.url``), so nothing else changes.
 
+Requests go through a persistent ``curl_cffi`` Session per worker thread
+(:func:`session`), so consecutive calls reuse the kept-alive TLS connection
+instead of handshaking with Akamai every time. Sessions aren't shared
+between threads; :func:`reset_session` drops the calling thread's one after
+a failed call so the retry starts on a fresh connection.
+
 Importing this module applies the patch. Import it once before any nba_api call.
 """
 
 from __future__ import annotations
 
 import logging
+import threading
 
 logger = logging.getLogger("pipeline.nba_http_patch")
 
 IMPERSONATE = "chrome"
 PATCHED = False
 
+_local = threading.local()
+
+
+def session():
+    """Return the calling thread's persistent ``curl_cffi`` Session (created lazily)."""
+    sess = getattr(_local, "session", None)
+    if sess is None:
+        from curl_cffi import requests as _cffi
+
+        sess = _local.session = _cffi.Session(impersonate=IMPERSONATE)
+        # One line per thread (and per reset) — more means connections
+        # aren't being reused.
+        logger.debug("Opened HTTP session for %s", threading.current_thread().name)
+    return sess
+
+
+def reset_session() -> None:
+    """Close and forget the calling thread's Session (next request reconnects)."""
+    sess = getattr(_local, "session", None)
+    _local.session = None
+    if sess is not None:
+        logger.debug("Dropped HTTP session for %s", threading.current_thread().name)
+        try:
+            sess.close()
+        except Exception:  # pragma: no cover - already broken connection
+            pass
+
+
 try:
-    from curl_cffi import requests as _cffi
+    import curl_cffi  # noqa: F401  — fail here (not on first call) if missing
     import nba_api.library.http as _nba_http
 
     class _CurlCffiRequests:
@@ -34,7 +69,7 @@ try:
         @staticmethod
         def get(*args, **kwargs):
             kwargs.setdefault("impersonate", IMPERSONATE)
-            return _cffi.get(*args, **kwargs)
+            return session().get(*args, **kwargs)
 
     # nba_api references the module global ``requests`` at call time, so
     # replacing it here transparently routes every stats request through curl_cffi.
@@ -6,13 +6,19 @@ retry / save / logging boiler‑plate.
 
 from __future__ import annotations
 
+import atexit
+import hashlib
+import json
 import logging
 import os
+import random
+import shutil
 import sys
+import threading
 import time
-from functools import reduce
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Type, TypeVar
 
 import pandas as pd
 
@@ -26,6 +32,24 @@ _LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s — %(message)s"
 _LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that runs ``strftime`` once per second, not once per record.
+
+    The date format has one‑second resolution, so every record logged in the
+    same second gets the same string.
+    """
+
+    _cached: tuple = (None, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        second = int(record.created)
+        cached_second, text = self._cached  # one tuple read — thread‑safe
+        if second != cached_second:
+            text = super().formatTime(record, datefmt)
+            self._cached = (second, text)
+        return text
+
+
 def setup_logging(level: int = logging.INFO) -> logging.Logger:
     """Configure and return the root pipeline logger.
 
@@ -41,7 +65,7 @@ def setup_logging(level: int = logging.INFO) -> logging.Logger:
     logger = logging.getLogger("pipeline")
     if not logger.handlers:
         handler = logging.StreamHandler(sys.stdout)
-        handler.setFormatter(logging.Formatter(_LOG_FORMAT, datefmt=_LOG_DATE_FORMAT))
+        handler.setFormatter(_CachedTimeFormatter(_LOG_FORMAT, datefmt=_LOG_DATE_FORMAT))
         logger.addHandler(handler)
     logger.setLevel(level)
     return logger
@@ -53,17 +77,226 @@ logger = setup_logging()
 # Global API‑call counter
 # ---------------------------------------------------------------------------
 
-_api_call_count: int = 0
+# One single‑element list per thread, registered on its first call: the
+# hot path bumps its own thread's slot without taking a lock, and the total
+# is summed only when someone asks for it.
+_api_call_local = threading.local()
+_api_call_counters: List[List[int]] = []
+_api_call_counters_lock = threading.Lock()
 
 
 def get_api_call_count() -> int:
     """Return the total number of API calls made in this process."""
-    return _api_call_count
+    with _api_call_counters_lock:
+        return sum(c[0] for c in _api_call_counters)
 
 
 def _increment_api_call_count() -> None:
-    global _api_call_count
-    _api_call_count += 1
+    counter = getattr(_api_call_local, "counter", None)
+    if counter is None:
+        counter = _api_call_local.counter = [0]
+        with _api_call_counters_lock:
+            _api_call_counters.append(counter)
+    counter[0] += 1
+
+
+# ---------------------------------------------------------------------------
+# Adaptive rate limiter
+# ---------------------------------------------------------------------------
+
+
+class RateLimiter:
+    """AIMD token bucket for API call starts, shared across threads.
+
+    Call starts average at most one per ``interval`` seconds across **all**
+    threads, so fanning calls out over a pool overlaps their latency without
+    raising the request rate past the cap. Up to *burst* calls may start
+    back‑to‑back when the bucket has refilled (e.g. a new section's first
+    fan‑out after a pause); after that callers wait only for the next token
+    instead of every call sleeping a fixed delay. A failed call halves the
+    rate (doubles ``interval``, up to *max_interval*); every *window*
+    consecutive successes add *step* calls/s back, up to ``1 / min_interval``.
+
+    Args:
+        min_interval: Fastest spacing between call starts (seconds).
+        max_interval: Slowest spacing after repeated failures (seconds).
+        step: Calls/s added back after each successful window.
+        window: Consecutive successes needed before speeding up.
+        burst: Bucket capacity — call starts allowed without spacing.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = config.API_MIN_INTERVAL,
+        max_interval: float = config.API_MAX_INTERVAL,
+        step: float = config.API_RATE_STEP,
+        window: int = config.API_RATE_WINDOW,
+        burst: int = config.API_RATE_BURST,
+    ) -> None:
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.step = step
+        self.window = window
+        self.burst = max(1, burst)
+        self.interval = min_interval
+        self._streak = 0
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def backed_off(self) -> bool:
+        """``True`` while failures have slowed the limiter below its cap."""
+        return self.interval > self.min_interval
+
+    def acquire(self) -> None:
+        """Block until the calling thread may take a token and start its call."""
+        with self._lock:
+            now = time.monotonic()
+            # _next_at is when the bucket would be empty again at the current
+            # rate (GCRA form of a token bucket): a call may start once it
+            # trails that by no more than burst‑1 intervals.
+            start = max(now, self._next_at - (self.burst - 1) * self.interval)
+            self._next_at = max(self._next_at, start) + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+    def record_success(self) -> None:
+        """Count a successful call; speed up additively after a full window."""
+        with self._lock:
+            self._streak += 1
+            if self._streak >= self.window:
+                self._streak = 0
+                self.interval = max(self.min_interval, 1.0 / (1.0 / self.interval + self.step))
+
+    def record_failure(self) -> None:
+        """Back off multiplicatively after a failed (timed‑out / throttled) call."""
+        with self._lock:
+            self._streak = 0
+            self.interval = min(self.max_interval, self.interval * 2)
+            logger.debug("Rate limiter backed off → %.2fs between calls", self.interval)
+
+
+_rate_limiter = RateLimiter()
+
+
+# ---------------------------------------------------------------------------
+# Circuit breaker
+# ---------------------------------------------------------------------------
+
+
+class CircuitBreaker:
+    """Pause all API calls after a run of consecutive failed attempts.
+
+    stats.nba.com fails in bursts — once calls start timing out, the next
+    ones usually do too. *threshold* consecutive failures (across all
+    threads) open the breaker for *cooldown* seconds, during which
+    :meth:`wait` holds every caller back instead of letting more calls
+    stall on timeouts. Calls are delayed, not dropped: after the cooldown
+    they go through and each keeps its own retries. A success closes the
+    breaker, a failure re‑opens it at once.
+
+    Args:
+        threshold: Consecutive failed attempts that open the breaker.
+        cooldown: Seconds the breaker stays open.
+    """
+
+    def __init__(
+        self,
+        threshold: int = config.API_BREAKER_THRESHOLD,
+        cooldown: float = config.API_BREAKER_COOLDOWN,
+    ) -> None:
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._open_until = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """Block while the breaker is open (re‑checking if it re‑opens meanwhile)."""
+        while True:
+            with self._lock:
+                remaining = self._open_until - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(remaining)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            failures = self._failures
+            opened = failures >= self.threshold
+            if opened:
+                self._open_until = time.monotonic() + self.cooldown
+        if opened:
+            logger.warning(
+                "%d consecutive API failures — pausing API calls for %.0fs",
+                failures,
+                self.cooldown,
+            )
+
+
+_circuit_breaker = CircuitBreaker()
+
+
+# ---------------------------------------------------------------------------
+# On‑disk response cache
+# ---------------------------------------------------------------------------
+
+# Per‑thread "the last api_call_with_retry was served from cache" flag, so
+# the following pace() can skip its sleep.
+_cache_state = threading.local()
+
+
+def _cache_path(endpoint_name: str, params: Dict[str, Any]) -> Path:
+    """Cache file for one ``(endpoint, params)`` request."""
+    key = json.dumps(params, sort_keys=True, default=str)
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return config.API_CACHE_DIR / endpoint_name / f"{digest}.json"
+
+
+def _load_cached(endpoint_class: Type[Any], params: Dict[str, Any]) -> Optional[Any]:
+    """Rebuild an endpoint from a fresh cached response, or return ``None``.
+
+    The endpoint is constructed with ``get_request=False`` and handed the
+    cached raw JSON, so callers get the same object (``get_dict()``,
+    ``get_data_frames()``) as from a live call.
+    """
+    endpoint_name = endpoint_class.__name__
+    path = _cache_path(endpoint_name, params)
+    ttl = config.API_CACHE_TTL_BY_ENDPOINT.get(endpoint_name, config.API_CACHE_TTL)
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        from nba_api.stats.library.http import NBAStatsResponse
+
+        result = endpoint_class(**params, get_request=False)
+        result.nba_response = NBAStatsResponse(
+            response=path.read_text(encoding="utf-8"), status_code=200, url=None
+        )
+        result.load_response()
+    except FileNotFoundError:
+        return None
+    except Exception as exc:
+        logger.warning("Ignoring cached %s response %s: %s", endpoint_name, path.name, exc)
+        return None
+    logger.debug("Cache hit: %s (%s)", endpoint_name, path.name)
+    return result
+
+
+def _store_cached(result: Any, params: Dict[str, Any]) -> None:
+    """Persist a live endpoint response's raw JSON (atomic temp + replace)."""
+    path = _cache_path(type(result).__name__, params)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp.write_text(result.nba_response.get_response(), encoding="utf-8")
+        tmp.replace(path)
+    except Exception as exc:  # caching must never fail a fetch
+        logger.warning("Could not cache %s response: %s", type(result).__name__, exc)
 
 
 # ---------------------------------------------------------------------------
@@ -71,24 +304,88 @@ def _increment_api_call_count() -> None:
 # ---------------------------------------------------------------------------
 
 
+def _reset_http_session() -> None:
+    """Drop this thread's pooled connection if the curl_cffi patch is loaded.
+
+    A timed-out or throttled keep-alive connection can stay wedged; the
+    retry should reconnect rather than reuse it. Looked up via
+    ``sys.modules`` so importing utils never applies the patch itself.
+    """
+    patch = sys.modules.get(f"{__package__}.nba_http_patch")
+    if patch is not None:
+        patch.reset_session()
+
+
+class _Truncate:
+    """Log argument that renders as ``str(obj)[:limit]`` — only when emitted."""
+
+    __slots__ = ("obj", "limit")
+
+    def __init__(self, obj: Any, limit: int) -> None:
+        self.obj = obj
+        self.limit = limit
+
+    def __str__(self) -> str:
+        return str(self.obj)[: self.limit]
+
+
+def _attempt_call(endpoint_class: Type[Any], params: Dict[str, Any], use_cache: bool = True) -> Any:
+    """One rate‑limited attempt; feeds the limiter and breaker either way.
+
+    Waits out an open circuit breaker first, and re‑raises whatever the
+    endpoint raised. With *use_cache* (and the cache enabled) a successful
+    response is stored.
+    """
+    _circuit_breaker.wait()
+    try:
+        _rate_limiter.acquire()
+        _increment_api_call_count()
+        result = endpoint_class(**params, timeout=config.API_TIMEOUT)
+    except Exception:
+        _rate_limiter.record_failure()
+        _circuit_breaker.record_failure()
+        _reset_http_session()
+        raise
+    _rate_limiter.record_success()
+    _circuit_breaker.record_success()
+    if use_cache and config.API_CACHE_ENABLED:
+        _store_cached(result, params)
+    return result
+
+
 def api_call_with_retry(
     endpoint_class: Type[Any],
     params: Dict[str, Any],
     retries: int = config.API_RETRIES,
     base_delay: float = config.API_BASE_DELAY,
+    use_cache: bool = True,
 ) -> Any:
-    """Call an ``nba_api`` endpoint with exponential‑backoff retry.
+    """Call an ``nba_api`` endpoint with jittered exponential‑backoff retry.
 
     Works with **any** ``nba_api.stats.endpoints`` class — just pass the
     class itself (not an instance) and a dict of keyword arguments.
 
+    With ``config.API_CACHE_ENABLED`` a fresh on‑disk copy of the same
+    request is returned instead (no HTTP call, no rate limiting, and the next
+    :func:`pace` in this thread doesn't sleep); live responses are cached.
+
+    Every attempt first waits out the shared :class:`CircuitBreaker`, so
+    during an outage calls pause together instead of each timing out.
+
+    The first attempt is made before (not inside) the retry loop: nearly
+    every call succeeds first time, and that path then returns without any
+    backoff bookkeeping. Keep it that way when editing the loop.
+
     Args:
         endpoint_class: The endpoint class, e.g.
             ``nba_api.stats.endpoints.LeagueDashLineups``.
         params: Keyword arguments forwarded to ``endpoint_class(**params)``.
         retries: Maximum number of attempts.
         base_delay: Seconds to wait after the first failure (doubles each
-            subsequent attempt).
+            subsequent attempt, capped at ``config.API_MAX_BACKOFF``; the
+            actual wait is drawn from the upper half of that range).
+        use_cache: ``False`` always calls the live API and doesn't store the
+            response, even with ``config.API_CACHE_ENABLED``.
 
     Returns:
         The instantiated endpoint object (call ``.get_data_frames()`` etc.
@@ -97,40 +394,314 @@ def api_call_with_retry(
     Raises:
         RuntimeError: If all retry attempts are exhausted.
     """
+    _cache_state.hit = False
+    if use_cache and config.API_CACHE_ENABLED:
+        cached = _load_cached(endpoint_class, params)
+        if cached is not None:
+            _cache_state.hit = True
+            return cached
+
+    # Fast path — the common case.
+    try:
+        return _attempt_call(endpoint_class, params, use_cache)
+    except Exception as exc:
+        last_exc = exc
+
     endpoint_name = endpoint_class.__name__
+    for attempt in range(1, retries):
+        # Jitter keeps the pool's workers from retrying in lock‑step.
+        delay = min(
+            config.API_MAX_BACKOFF,
+            base_delay * (config.API_BACKOFF_MULTIPLIER ** (attempt - 1)),
+        )
+        delay = random.uniform(delay / 2, delay)
+        logger.warning(
+            "%s attempt %d/%d failed: %s — retrying in %.1fs",
+            endpoint_name,
+            attempt,
+            retries,
+            _Truncate(last_exc, 200),
+            delay,
+        )
+        time.sleep(delay)
+        try:
+            result = _attempt_call(endpoint_class, params, use_cache)
+        except Exception as exc:
+            last_exc = exc
+            continue
+        logger.debug("API call succeeded: %s (attempt %d)", endpoint_name, attempt + 1)
+        return result
+
+    logger.error(
+        "%s failed after %d attempts: %s",
+        endpoint_name,
+        retries,
+        _Truncate(last_exc, 300),
+    )
+    raise RuntimeError(f"{endpoint_name} failed after {retries} attempts") from last_exc
+
+
+# ---------------------------------------------------------------------------
+# Result‑set extraction
+# ---------------------------------------------------------------------------
+
+
+def result_set_frames(result: Any, *indices: int) -> Optional[List[pd.DataFrame]]:
+    """Build DataFrames for only the requested result sets of an endpoint response.
+
+    ``get_data_frames()`` materialises *every* result set the endpoint
+    returns; most callers keep one or two. This builds just the positions
+    asked for — the same positions ``get_data_frames()`` would use — from
+    the ``data_sets`` nba_api already parsed when the endpoint loaded its
+    response, so the JSON is never decoded a second time.
+
+    Objects without ``data_sets`` fall back to the raw JSON
+    (``result.get_dict()``), in either the ``resultSets`` list or the single
+    ``resultSet`` object shape.
+
+    Args:
+        result: An instantiated ``nba_api`` endpoint (e.g. from
+            :func:`api_call_with_retry`).
+        *indices: Result‑set positions to build.
+
+    Returns:
+        One DataFrame per index, or ``None`` if the response has fewer
+        result sets than requested.
+    """
+    data_sets = getattr(result, "data_sets", None)
+    if data_sets is not None:
+        if not indices or max(indices) >= len(data_sets):
+            return None
+        return [data_sets[i].get_data_frame() for i in indices]
+
+    raw = result.get_dict()
+    result_sets = raw.get("resultSets") or raw.get("resultSet") or []
+    if isinstance(result_sets, dict):
+        result_sets = [result_sets]
+    if not indices or max(indices) >= len(result_sets):
+        return None
+    return [
+        pd.DataFrame(result_sets[i]["rowSet"], columns=result_sets[i]["headers"])
+        for i in indices
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Concurrent fan-out
+# ---------------------------------------------------------------------------
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+_POOL_PREFIX = "pipeline-api"
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _api_pool() -> ThreadPoolExecutor:
+    """Return the process‑wide API worker pool (created on first use).
+
+    It lives for the whole run so each worker's kept‑alive HTTP session
+    (see :mod:`pipeline.nba_http_patch`) carries over from one fetch
+    section to the next instead of being re‑handshaken per section.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(
+                max_workers=config.API_MAX_WORKERS, thread_name_prefix=_POOL_PREFIX
+            )
+        return _pool
+
+
+def map_concurrently(
+    fn: Callable[[_T], _R],
+    items: Iterable[_T],
+    max_workers: Optional[int] = None,
+) -> List[_R]:
+    """Apply *fn* to every item on a bounded thread pool; results keep input order.
+
+    Meant for independent, network‑bound API calls — the shared
+    :class:`RateLimiter` in :func:`api_call_with_retry` still caps the
+    overall request rate. *fn* should handle its own errors; an exception
+    propagates to the caller.
+
+    By default the shared, long‑lived pool of ``config.API_MAX_WORKERS``
+    threads is used. Called from one of its own workers, the items run
+    inline instead (a nested fan‑out on a bounded pool could deadlock).
+
+    Args:
+        fn: Work function, called once per item.
+        items: Inputs to fan out.
+        max_workers: Use a one‑off pool of this size instead of the shared one.
+
+    Returns:
+        ``[fn(item) for item in items]``, computed concurrently.
+    """
+    if max_workers is not None:
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=_POOL_PREFIX) as pool:
+            return list(pool.map(fn, items))
+    if threading.current_thread().name.startswith(_POOL_PREFIX):
+        return [fn(item) for item in items]
+    return list(_api_pool().map(fn, items))
+
+
+def gather_api_calls(
+    specs: Iterable[tuple],
+    retries: int = config.API_RETRIES,
+    base_delay: float = config.API_BASE_DELAY,
+    use_cache: bool = True,
+) -> List[Any]:
+    """Submit a batch of independent endpoint calls together; reap them in order.
+
+    Each spec is an ``(endpoint_class, params)`` pair handed to
+    :func:`api_call_with_retry`, fanned out over :func:`map_concurrently`,
+    so the batch costs about its slowest call instead of the sum. A failed
+    call doesn't abort the others: its exception is returned in its slot.
+
+    Args:
+        specs: ``(endpoint_class, params)`` pairs.
+        retries: Forwarded to :func:`api_call_with_retry`.
+        base_delay: Forwarded to :func:`api_call_with_retry`.
+        use_cache: Forwarded to :func:`api_call_with_retry`.
+
+    Returns:
+        One endpoint object — or the exception it raised — per spec.
+    """
+
+    def _call(spec: tuple) -> Any:
+        endpoint_class, params = spec
+        try:
+            return api_call_with_retry(
+                endpoint_class, params, retries=retries, base_delay=base_delay, use_cache=use_cache
+            )
+        except Exception as exc:
+            return exc
+
+    return map_concurrently(_call, specs)
+
+
+def warm_up_connections(url: str = "https://stats.nba.com/", timeout: float = 10.0) -> int:
+    """Open every pool worker's kept‑alive connection ahead of the first fetch.
 
-    for attempt in range(retries):
+    Each worker sends one cheap request through its own curl_cffi session,
+    so the TLS handshakes (and DNS lookup) happen here, once, rather than
+    on the first real call of each thread. The requests wait out the
+    circuit breaker and take rate‑limiter tokens like any API call, so
+    warm‑up and the first real calls don't land on the server as one burst.
+    No‑op unless the nba_api HTTP patch is active. Failures are ignored —
+    the real calls just connect themselves.
+
+    Args:
+        url: Any stats.nba.com URL; only the connection matters.
+        timeout: Per‑request (and rendezvous) timeout in seconds.
+
+    Returns:
+        Number of workers whose warm‑up request succeeded.
+    """
+    patch = sys.modules.get(f"{__package__}.nba_http_patch")
+    if patch is None or not patch.PATCHED:
+        return 0
+    workers = config.API_MAX_WORKERS
+    # Every item waits for the others, so each lands on a different worker.
+    barrier = threading.Barrier(workers)
+
+    def _warm(_: int) -> bool:
+        try:
+            barrier.wait(timeout=timeout)
+        except threading.BrokenBarrierError:
+            pass
+        _circuit_breaker.wait()
+        _rate_limiter.acquire()
         try:
-            _increment_api_call_count()
-            result = endpoint_class(**params, timeout=config.API_TIMEOUT)
-            logger.debug("API call succeeded: %s (attempt %d)", endpoint_name, attempt + 1)
-            return result
+            patch.session().head(url, timeout=timeout)
+            return True
+        except Exception as exc:
+            logger.debug("Connection warm‑up failed: %s", exc)
+            return False
+
+    return sum(map_concurrently(_warm, range(workers)))
+
+
+# ---------------------------------------------------------------------------
+# Checkpoint / resume
+# ---------------------------------------------------------------------------
+
+
+def map_checkpointed(
+    name: str,
+    fn: Callable[[_T], Any],
+    items: Iterable[_T],
+    key: Callable[[_T], Any] = lambda item: item,
+) -> List[Any]:
+    """:func:`map_concurrently` that can resume an interrupted earlier run.
 
+    Every non‑empty DataFrame *fn* returns is written to
+    ``config.CHECKPOINT_DIR / name`` as soon as it arrives; an item whose
+    result is already there (and younger than ``config.CHECKPOINT_TTL``) is
+    loaded instead of fetched. Failed / empty items are never saved, so a
+    rerun only repeats those — so *fn* must return ``None`` rather than a
+    partial frame when part of its item failed (checkpoint at the level
+    where a call either fully succeeds or not). Call
+    :func:`clear_checkpoint` once the fetch's output file is written.
+
+    Args:
+        name: Checkpoint name — unique per fetch and season.
+        fn: Work function, called once per item not yet checkpointed.
+        items: Inputs to fan out.
+        key: Maps an item to its stable identity (e.g. drops a progress index).
+
+    Returns:
+        ``[fn(item) for item in items]``, with checkpointed results reused.
+    """
+    directory = config.CHECKPOINT_DIR / name
+
+    def _run(item: _T) -> Any:
+        digest = hashlib.sha1(repr(key(item)).encode("utf-8")).hexdigest()
+        path = directory / f"{digest}.parquet"
+        try:
+            if time.time() - path.stat().st_mtime <= config.CHECKPOINT_TTL:
+                logger.debug("Resumed %s %r from checkpoint", name, key(item))
+                return pd.read_parquet(path)
+        except FileNotFoundError:
+            pass
         except Exception as exc:
-            wait = base_delay * (config.API_BACKOFF_MULTIPLIER ** attempt)
-            if attempt < retries - 1:
-                logger.warning(
-                    "%s attempt %d/%d failed: %s — retrying in %.1fs",
-                    endpoint_name,
-                    attempt + 1,
-                    retries,
-                    str(exc)[:200],
-                    wait,
-                )
-                time.sleep(wait)
-            else:
-                logger.error(
-                    "%s failed after %d attempts: %s",
-                    endpoint_name,
-                    retries,
-                    str(exc)[:300],
-                )
-                raise RuntimeError(
-                    f"{endpoint_name} failed after {retries} attempts"
-                ) from exc
-
-    # Should never reach here, but satisfy type checkers.
-    raise RuntimeError(f"{endpoint_name} exhausted retries")  # pragma: no cover
+            logger.warning("Ignoring checkpoint %s/%s: %s", name, path.name, exc)
+
+        result = fn(item)
+        if isinstance(result, pd.DataFrame) and not result.empty:
+            try:
+                directory.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+                result.to_parquet(tmp, index=False)
+                tmp.replace(path)
+            except Exception as exc:  # checkpointing must never fail a fetch
+                logger.warning("Could not checkpoint %s %r: %s", name, key(item), exc)
+        return result
+
+    return map_concurrently(_run, items)
+
+
+def clear_checkpoint(name: str) -> None:
+    """Delete a fetch's checkpoint once its output has been saved.
+
+    Queued behind the background writes already submitted, and skipped if
+    any of them failed — the checkpoint is then still there for a rerun.
+    """
+    with _pending_lock:
+        pending = list(_pending_writes)
+
+    def _clear() -> None:
+        # Everything in *pending* was queued earlier, so it is already running
+        # or done by the time this task starts — waiting can't deadlock.
+        wait(pending)
+        if any(f.exception() is not None for f in pending):
+            logger.warning("Keeping checkpoint %s — an output write failed", name)
+            return
+        shutil.rmtree(config.CHECKPOINT_DIR / name, ignore_errors=True)
+
+    _submit_io(_clear)
 
 
 # ---------------------------------------------------------------------------
@@ -140,12 +711,14 @@ def api_call_with_retry(
 
 def merge_measure_types(
     dataframes_dict: Dict[str, pd.DataFrame],
-    merge_key: str = "GROUP_ID",
+    merge_key: str | List[str] = "GROUP_ID",
 ) -> pd.DataFrame:
     """Merge multiple DataFrames (one per measure‑type) on a shared key.
 
     Duplicate columns (other than *merge_key*) are kept only from the first
-    DataFrame that introduced them.
+    DataFrame that introduced them. No rows are dropped: if a key repeats
+    within a frame, its repeats are paired across frames by occurrence
+    (first with first, second with second, …).
 
     Args:
         dataframes_dict: ``{measure_type_name: DataFrame, ...}``.
@@ -157,24 +730,72 @@ def merge_measure_types(
     if not dataframes_dict:
         return pd.DataFrame()
 
-    frames: List[pd.DataFrame] = []
-    seen_cols: set = {merge_key}
+    keys = [merge_key] if isinstance(merge_key, str) else list(merge_key)
+
+    # (frame, columns to take from it) — the projection is deferred to the
+    # concat step so each frame's kept columns are copied once, not twice.
+    frames: List[tuple] = []
+    seen_cols = pd.Index(keys)
 
     for measure_type, df in dataframes_dict.items():
         if df is None or df.empty:
             logger.warning("Skipping empty DataFrame for measure type '%s'", measure_type)
             continue
-        # Keep only the merge key plus columns we haven't seen yet.
-        new_cols = [c for c in df.columns if c not in seen_cols or c == merge_key]
-        if not new_cols or merge_key not in new_cols:
+        if not set(keys).issubset(df.columns):
             continue
-        frames.append(df[new_cols])
-        seen_cols.update(new_cols)
+        # Keep only the merge key plus columns we haven't seen yet — one
+        # vectorised hash probe per frame, in the frame's own column order.
+        new_cols = df.columns[~df.columns.isin(seen_cols) | df.columns.isin(keys)]
+        frames.append((df, new_cols))
+        seen_cols = seen_cols.union(new_cols, sort=False)
 
     if not frames:
         return pd.DataFrame()
 
-    merged = reduce(lambda left, right: pd.merge(left, right, on=merge_key, how="outer"), frames)
+    # One index-aligned concat instead of N-1 chained merges (each of which
+    # re-hashed the key and materialised an intermediate frame).
+    if len(frames) == 1:
+        df, cols = frames[0]
+        return _log_merged(frames, df[cols])
+
+    # Alignment needs a unique index; when any frame repeats a key, every
+    # frame gets the key's occurrence number as an extra index level.
+    dupe_counts = [int(df.duplicated(subset=keys).sum()) for df, _ in frames]
+    if any(dupe_counts):
+        logger.warning(
+            "%d duplicate %s rows — pairing them across measure types by occurrence",
+            max(dupe_counts),
+            "/".join(keys),
+        )
+
+    indexed: List[pd.DataFrame] = []
+    for df, cols in frames:
+        levels = [df[k].to_numpy() for k in keys]
+        names: List[Optional[str]] = list(keys)
+        if any(dupe_counts):
+            levels.append(df.groupby(keys, sort=False).cumcount().to_numpy())
+            names.append(None)
+        # Select the value columns and attach the key as the index in place,
+        # rather than df[cols] followed by set_index (a second full copy).
+        part = df[cols.drop(keys)]
+        part.index = (
+            pd.MultiIndex.from_arrays(levels, names=names)
+            if len(levels) > 1
+            else pd.Index(levels[0], name=names[0])
+        )
+        indexed.append(part)
+    # copy=False: the block data goes straight into the result; when the
+    # frames share one index (the usual case) no row reindexing happens at all.
+    merged = pd.concat(indexed, axis=1, join="outer", copy=False).sort_index().reset_index()
+
+    # Same layout the chained outer merge produced: the first frame's columns
+    # in place, then each later frame's new columns (the occurrence level, if
+    # any, is dropped here).
+    order = list(frames[0][1]) + [c for _, cols in frames[1:] for c in cols if c not in keys]
+    return _log_merged(frames, merged[order])
+
+
+def _log_merged(frames: List[tuple], merged: pd.DataFrame) -> pd.DataFrame:
     logger.info(
         "Merged %d measure‑type frames → %d rows × %d cols",
         len(frames),
@@ -184,6 +805,35 @@ def merge_measure_types(
     return merged
 
 
+# ---------------------------------------------------------------------------
+# Dtype helper
+# ---------------------------------------------------------------------------
+
+
+def shrink_dtypes(df: pd.DataFrame, categorical: Iterable[str] = ()) -> pd.DataFrame:
+    """Narrow a fetched frame's dtypes without changing its CSV output.
+
+    The listed repeated‑string columns (those present) become ``category``
+    and integer columns are downcast to the smallest integer type that fits.
+    Floats stay ``float64`` — narrowing them would change the digits written
+    to the published CSVs.
+
+    Args:
+        df: Frame to shrink (not modified).
+        categorical: Column names to store as ``category``.
+
+    Returns:
+        The frame with narrowed dtypes.
+    """
+    out = df.copy(deep=False)
+    for col in categorical:
+        if col in out.columns:
+            out[col] = out[col].astype("category")
+    for col in out.select_dtypes("integer").columns:
+        out[col] = pd.to_numeric(out[col], downcast="integer")
+    return out
+
+
 # ---------------------------------------------------------------------------
 # Health check
 # ---------------------------------------------------------------------------
@@ -192,40 +842,61 @@ def merge_measure_types(
 def health_check(season: str = config.SEASON) -> bool:
     """Quick connectivity test against the NBA Stats API.
 
-    Attempts a lightweight ``LeagueDashLineups`` call (Base, 5‑man, single
-    page) and returns ``True`` on success.
+    Submits lightweight ``LeagueDashLineups`` calls (5‑man, single page) for
+    the Base, Advanced and Scoring measure types in one
+    :func:`gather_api_calls` round, so the measure‑type variants the lineup
+    fetch depends on are all checked for about the cost of one call.
 
     Args:
         season: Season string, e.g. ``"2025-26"``.
 
     Returns:
-        ``True`` if the API responded with data, ``False`` otherwise.
+        ``True`` if every call got a response, ``False`` otherwise.
     """
     from nba_api.stats.endpoints import leaguedashlineups
 
+    measure_types = ("Base", "Advanced", "Scoring")
     logger.info("Running API health check for season %s …", season)
-    try:
-        result = api_call_with_retry(
-            leaguedashlineups.LeagueDashLineups,
-            params=dict(
-                group_quantity=5,
-                measure_type_detailed_defense="Base",
-                per_mode_detailed="Totals",
-                season=season,
-                season_type_all_star="Regular Season",
-            ),
-            retries=3,
-            base_delay=2.0,
-        )
-        dfs = result.get_data_frames()
-        if dfs and len(dfs[0]) > 0:
-            logger.info("✓ Health check passed — got %d rows.", len(dfs[0]))
-            return True
-        logger.warning("⚠ Health check: API responded but returned 0 rows.")
-        return True  # API is reachable even if season has no data yet
-    except Exception as exc:
-        logger.error("✗ Health check failed: %s", exc)
-        return False
+    # Always probe the live API: a cached response (NBA_API_CACHE=1 turns the
+    # cache on at import) says nothing about reachability.
+    results = gather_api_calls(
+        [
+            (
+                leaguedashlineups.LeagueDashLineups,
+                dict(
+                    group_quantity=5,
+                    measure_type_detailed_defense=measure_type,
+                    per_mode_detailed="Totals",
+                    season=season,
+                    season_type_all_star="Regular Season",
+                ),
+            )
+            for measure_type in measure_types
+        ],
+        retries=3,
+        base_delay=2.0,
+        use_cache=False,
+    )
+
+    healthy = True
+    for measure_type, result in zip(measure_types, results):
+        if isinstance(result, Exception):
+            logger.error("✗ Health check failed (%s): %s", measure_type, result)
+            healthy = False
+            continue
+        try:
+            frames = result_set_frames(result, 0)
+        except Exception as exc:
+            logger.error("✗ Health check failed (%s): %s", measure_type, exc)
+            healthy = False
+            continue
+        rows = len(frames[0]) if frames else 0
+        if rows:
+            logger.info("✓ Health check passed (%s) — got %d rows.", measure_type, rows)
+        else:
+            # API is reachable even if season has no data yet
+            logger.warning("⚠ Health check (%s): API responded but returned 0 rows.", measure_type)
+    return healthy
 
 
 # ---------------------------------------------------------------------------
@@ -233,17 +904,133 @@ def health_check(season: str = config.SEASON) -> bool:
 # ---------------------------------------------------------------------------
 
 
-def save_dataframe(df: pd.DataFrame, filepath: str | Path) -> None:
-    """Save a DataFrame to CSV, creating parent directories as needed.
+# Writes run on a small background pool so the pipeline can issue its next
+# API calls while finished results drain to disk.
+_IO_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pipeline-io")
+_pending_writes: Set[Future] = set()
+_failed_writes: List[Path] = []
+_pending_lock = threading.Lock()
+
+
+# Frames up to this in‑memory size are rendered to CSV in memory and written
+# with a single write; bigger ones stream straight to the file.
+_CSV_BUFFER_LIMIT = 64 * 1024 * 1024
+
+
+def _write_file(df: pd.DataFrame, filepath: Path) -> None:
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    if filepath.suffix == ".parquet":
+        df.to_parquet(filepath, engine="pyarrow", compression="zstd", index=False)
+    elif df.memory_usage(index=False, deep=True).sum() <= _CSV_BUFFER_LIMIT:
+        filepath.write_bytes(df.to_csv(index=False).encode("utf-8"))
+    else:
+        df.to_csv(filepath, index=False)
+    logger.info(
+        "Saved %d rows × %d cols → %s (%.1f KiB)",
+        len(df),
+        len(df.columns),
+        filepath,
+        filepath.stat().st_size / 1024,
+    )
+
+
+def _submit_io(fn: Callable[..., None], *args: Any, path: Optional[Path] = None) -> Future:
+    """Queue *fn* on the I/O pool and track it until it finishes.
+
+    A failure of a task writing *path* is remembered for
+    :func:`drain_pending_writes` to report.
+    """
+    future = _IO_POOL.submit(fn, *args)
+    with _pending_lock:
+        _pending_writes.add(future)
+    future.add_done_callback(lambda f: _io_done(f, path))
+    return future
+
+
+def _io_done(future: Future, path: Optional[Path]) -> None:
+    exc = future.exception()
+    with _pending_lock:
+        _pending_writes.discard(future)
+        if exc is not None and path is not None:
+            _failed_writes.append(path)
+    if exc is not None:
+        logger.error("Background write failed: %s", exc)
+
+
+def drain_pending_writes() -> List[Path]:
+    """Block until every queued :func:`save_dataframe` write has finished.
+
+    Call before reading back files written earlier in the same run (also
+    registered to run at interpreter exit).
+
+    Returns:
+        Paths whose write failed since the previous drain — their sections
+        should be reported as failed.
+    """
+    with _pending_lock:
+        pending = list(_pending_writes)
+    if pending:
+        wait(pending)
+    with _pending_lock:
+        failed = list(_failed_writes)
+        _failed_writes.clear()
+    return failed
+
+
+atexit.register(drain_pending_writes)
+
+
+def parquet_twin_path(filepath: str | Path) -> Path:
+    """Where :func:`save_dataframe` puts the Parquet twin of a CSV output.
+
+    Twins live under ``config.PARQUET_DIR`` (git‑ignored), mirroring the
+    CSV's path below ``config.DATA_DIR``, so ``git add data/`` never picks
+    them up.
+    """
+    filepath = Path(filepath).resolve()
+    try:
+        relative = filepath.relative_to(config.DATA_DIR)
+    except ValueError:
+        relative = Path(filepath.name)
+    return (config.PARQUET_DIR / relative).with_suffix(".parquet")
+
+
+def save_dataframe(df: pd.DataFrame, filepath: str | Path, twin: bool = False) -> Future:
+    """Save a DataFrame in the background, creating parent directories as needed.
+
+    The format follows the suffix: ``.parquet`` is written with pyarrow and
+    zstd compression (list / typed columns survive the round trip), anything
+    else as CSV. The write is queued on the I/O pool and this returns at
+    once; a failure is logged and reported by :func:`drain_pending_writes`
+    (``.result()`` re‑raises it). Don't modify *df* afterwards, and call
+    ``.result()`` (or :func:`drain_pending_writes`) before reading the file.
+
+    With *twin*, a ``.parquet`` copy is written to
+    :func:`parquet_twin_path` for the pipeline's own re‑reads (the CSV
+    stays the published file). It is
+    written in the same task, *after* the CSV, so its mtime marks it as
+    current for ``export_web._read_table``; a failed twin only logs.
 
     Args:
         df: The DataFrame to persist.
         filepath: Destination path (absolute or relative to cwd).
+        twin: Also write a Parquet twin of a CSV output.
+
+    Returns:
+        The write's ``Future``.
     """
     filepath = Path(filepath)
-    filepath.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(filepath, index=False)
-    logger.info("Saved %d rows × %d cols → %s", len(df), len(df.columns), filepath)
+
+    def _write() -> None:
+        _write_file(df, filepath)
+        if twin:
+            twin_path = parquet_twin_path(filepath)
+            try:
+                _write_file(df, twin_path)
+            except Exception as exc:
+                logger.warning("Parquet copy %s skipped: %s", twin_path.name, exc)
+
+    return _submit_io(_write, path=filepath)
 
 
 # ---------------------------------------------------------------------------
@@ -251,12 +1038,66 @@ def save_dataframe(df: pd.DataFrame, filepath: str | Path) -> None:
 # ---------------------------------------------------------------------------
 
 _TEAM_MAP: Optional[Dict[int, str]] = None
+_TEAM_ABBREVIATIONS: Optional[Dict[int, str]] = None
+
+
+def get_team_map() -> Dict[int, str]:
+    """Return the cached ``{team_id: full_name}`` map for all 30 teams.
+
+    Loaded from ``config.TEAMS_CACHE_PATH`` when present; otherwise built
+    from ``nba_api.stats.static.teams`` and written there, so later runs
+    skip importing the static team module. Pass it to ``Series.map`` to
+    name a whole ``TEAM_ID`` column in one vectorised lookup instead of a
+    per‑row :func:`get_team_name` call.
+
+    Returns:
+        Mapping of NBA team id to full team name.
+    """
+    if _TEAM_MAP is None:
+        _load_team_maps()
+    return _TEAM_MAP  # type: ignore[return-value]
+
+
+def get_team_abbreviations() -> Dict[int, str]:
+    """Return the cached ``{team_id: abbreviation}`` map (same source as :func:`get_team_map`)."""
+    if _TEAM_ABBREVIATIONS is None:
+        _load_team_maps()
+    return _TEAM_ABBREVIATIONS  # type: ignore[return-value]
+
+
+def _load_team_maps() -> None:
+    global _TEAM_MAP, _TEAM_ABBREVIATIONS
+    path = config.TEAMS_CACHE_PATH
+    try:
+        # Stored as [[id, name, abbreviation], ...] — JSON object keys would
+        # come back as str. An older two‑field file fails to unpack → rebuilt.
+        rows = [(int(team_id), name, abbr) for team_id, name, abbr in json.loads(path.read_bytes())]
+    except FileNotFoundError:
+        rows = None
+    except Exception as exc:
+        logger.warning("Ignoring team cache %s: %s", path, exc)
+        rows = None
+
+    if rows is None:
+        from nba_api.stats.static import teams
+
+        rows = sorted((t["id"], t["full_name"], t["abbreviation"]) for t in teams.get_teams())
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(rows), encoding="utf-8")
+            os.replace(tmp, path)
+        except Exception as exc:  # the cache is an optimisation only
+            logger.warning("Could not cache team map: %s", exc)
+
+    _TEAM_ABBREVIATIONS = {team_id: abbr for team_id, _, abbr in rows}
+    _TEAM_MAP = {team_id: name for team_id, name, _ in rows}
 
 
 def get_team_name(team_id: int) -> str:
     """Return the full team name for a given ``team_id``.
 
-    Uses ``nba_api.stats.static.teams`` and caches the result.
+    A dict probe against :func:`get_team_map`.
 
     Args:
         team_id: NBA team identifier.
@@ -265,23 +1106,19 @@ def get_team_name(team_id: int) -> str:
         Full team name (e.g. ``"Los Angeles Lakers"``), or ``"Unknown"`` if
         the id is not found.
     """
-    global _TEAM_MAP
-    if _TEAM_MAP is None:
-        from nba_api.stats.static import teams
-
-        _TEAM_MAP = {t["id"]: t["full_name"] for t in teams.get_teams()}
-    return _TEAM_MAP.get(team_id, "Unknown")
+    return get_team_map().get(team_id, "Unknown")
 
 
 def get_all_team_ids() -> List[int]:
     """Return a list of all 30 NBA team IDs.
 
+    Derived from the cached :func:`get_team_map`, so the per‑combo callers
+    in the lineup fetch don't rebuild the static team list every time.
+
     Returns:
         Sorted list of integer team IDs.
     """
-    from nba_api.stats.static import teams
-
-    return sorted([t["id"] for t in teams.get_teams()])
+    return sorted(get_team_map())
 
 
 # ---------------------------------------------------------------------------
@@ -290,9 +1127,17 @@ def get_all_team_ids() -> List[int]:
 
 
 def pace(delay: float = config.API_CALL_DELAY) -> None:
-    """Sleep for *delay* seconds to respect API rate limits.
+    """Cool down after an API call — only while the rate limiter is backed off.
+
+    Call spacing is the shared :class:`RateLimiter`'s job; while calls are
+    succeeding this returns immediately. After failures have slowed the
+    limiter, it sleeps up to *delay* (at most the current call interval) so
+    each worker also eases off. Skipped when this thread's last
+    :func:`api_call_with_retry` was served from the response cache.
 
     Args:
-        delay: Seconds to sleep.
+        delay: Maximum seconds to sleep.
     """
-    time.sleep(delay)
+    if getattr(_cache_state, "hit", False) or not _rate_limiter.backed_off:
+        return
+    time.sleep(min(delay, _rate_limiter.interval))